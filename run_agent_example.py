@@ -24,18 +24,27 @@ def main():
 
         # Get system status
         status = orchestrator.get_agent_status()
-        print(f"✓ Initialized {status['total_agents']} agents")
-        print(f"✓ Loaded {status['cloudwatch_tools']} CloudWatch tools")
-        print(f"✓ Model client ready: {status['model_client_ready']}")
-        print(f"✓ Team ready: {status['team_ready']}")
+        status_lines = [
+            f"✓ Initialized {status['total_agents']} agents",
+            f"✓ Loaded {status['cloudwatch_tools']} CloudWatch tools",
+            f"✓ Model client ready: {status['model_client_ready']}",
+            f"✓ Team ready: {status['team_ready']}",
+        ]
+        print("\n".join(status_lines))
 
         if not status["model_client_ready"]:
-            print("\n⚠️  Warning: No AI API key found. Set one of:")
-            print("   - OPENAI_API_KEY")
-            print("   - ANTHROPIC_API_KEY")
-            print("   - AZURE_OPENAI_API_KEY")
-            print("   - GOOGLE_API_KEY")
-            print("   - MISTRAL_API_KEY")
+            print(
+                "\n".join(
+                    (
+                        "\n⚠️  Warning: No AI API key found. Set one of:",
+                        "   - OPENAI_API_KEY",
+                        "   - ANTHROPIC_API_KEY",
+                        "   - AZURE_OPENAI_API_KEY",
+                        "   - GOOGLE_API_KEY",
+                        "   - MISTRAL_API_KEY",
+                    )
+                )
+            )
             return
 
         if not status["team_ready"]:
@@ -43,9 +52,7 @@ def main():
             return
 
         # Run a simple investigation
-        print("\n" + "=" * 40)
-        print("Running sample investigation...")
-        print("=" * 40)
+        print("\n".join(("\n" + "=" * 40, "Running sample investigation...", "=" * 40)))
 
         instruction = "過去1時間でERRORレベルのログを調査してください。"
         print(f"Instruction: {instruction}")
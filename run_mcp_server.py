@@ -4,12 +4,17 @@ CloudWatch Logs MCP Server Launcher
 
 シンプルなMCPサーバー起動スクリプト
 テスト・開発環境での使用に最適化
+
+開発用オプション:
+    --reload / DEV_RELOAD=1  起動前に src.mcp / src.agents のモジュールキャッシュを破棄
+    --skip-checks / MCP_SKIP_CHECKS=1  起動時の環境チェックを省略（ウォームスタート用）
 """
 
 import asyncio
 import logging
 import sys
 import os
+import traceback
 from pathlib import Path
 
 # プロジェクトルートをPythonパスに追加
@@ -19,51 +24,81 @@ sys.path.insert(0, str(project_root))
 # --- Module Cache Busting ---
 # To ensure code changes are loaded during development,
 # explicitly remove modules from the cache before import.
-modules_to_clear = [
-    "src.mcp.server",
-    "src.mcp.tools",
-    "src.mcp.config",
-    "src.mcp.validators",
-    "src.mcp.request_handler",
-    "src.mcp",
-    "src.agents.cloudwatch_agent",
-    "src.agents.instruction_agent",
-    "src.agents.investigation_agent",
-    "src.agents.reporting_agent",
-    "src.agents.orchestrator",
-]
-for module in modules_to_clear:
-    if module in sys.modules:
+# Only enabled with --reload or DEV_RELOAD=1 so normal launches
+# reuse the import cache.
+MODULE_PREFIXES_TO_CLEAR = ("src.mcp", "src.agents")
+if "--reload" in sys.argv or os.getenv("DEV_RELOAD"):
+    # パッケージ本体とそのサブモジュールをまとめて破棄
+    _submodule_prefixes = tuple(f"{prefix}." for prefix in MODULE_PREFIXES_TO_CLEAR)
+    for module in [
+        name
+        for name in sys.modules
+        if name in MODULE_PREFIXES_TO_CLEAR or name.startswith(_submodule_prefixes)
+    ]:
         del sys.modules[module]
 # -----------------------------
 
 # 環境変数を早期に読み込む
 # 優先順位: 外部環境変数 > .env.mcp > .env.local > .env
 # override=False により、外部から渡された環境変数（MCPのenvセクション等）を保護
-try:
-    from dotenv import load_dotenv
-
-    # 複数の.envファイルを順番に読み込み（外部環境変数を上書きしない）
-    env_files = [".env.mcp", ".env.local", ".env"]
-    for env_file in env_files:
-        if Path(env_file).exists():
-            load_dotenv(env_file, override=False)  # 外部環境変数を保護
-            print(f"✅ 環境ファイルを読み込みました: {env_file}")
-            break
-    else:
-        print("ℹ️  環境ファイルが見つかりません (.env, .env.local, .env.mcp)")
-except ImportError:
-    print("⚠️  dotenvが利用できません。環境変数を手動で設定してください。")
+ENV_FILES = (".env.mcp", ".env.local", ".env")
+
+
+def _load_env_files(files):
+    """最初に見つかった.envファイルを読み込み、各ファイルの存在状況を返す
 
-try:
-    from src.mcp.server import CloudWatchMCPServer
-    from src.mcp.config import load_config
-except ImportError as e:
-    print(f"❌ インポートエラー: {e}")
-    print("必要なモジュールがインストールされていない可能性があります。")
-    print("pip install -r requirements.txt を実行してください。")
-    sys.exit(1)
+    各ファイルの存在確認は stat 1回ずつ、パースは読み込むファイルのみ1回行う。
 
+    Returns:
+        (ファイル名, 存在するか) のリスト
+    """
+    status = []
+    loaded = None
+    for env_file in files:
+        exists = os.path.isfile(env_file)
+        status.append((env_file, exists))
+        if exists and loaded is None:
+            loaded = env_file
+
+    if loaded is None:
+        print("ℹ️  環境ファイルが見つかりません (.env, .env.local, .env.mcp)")
+        return status
+
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        print("⚠️  dotenvが利用できません。環境変数を手動で設定してください。")
+        return status
+    values = dotenv_values(loaded)
+
+    # 外部環境変数を保護（override=False 相当）
+    os.environ.update(
+        {k: v for k, v in values.items() if v is not None and k not in os.environ}
+    )
+    print(f"✅ 環境ファイルを読み込みました: {loaded}")
+    return status
+
+
+ENV_STATUS = _load_env_files(ENV_FILES)
+
+# 環境チェックで存在を確認するファイル
+REQUIRED_FILES = (
+    "src/mcp/server.py",
+    "src/mcp/config.py",
+    "src/mcp/tools.py",
+    "requirements.txt",
+)
+
+# 起動時に表示する環境変数
+DISPLAY_ENV_VARS = (
+    "MCP_SERVER__TRANSPORT",
+    "MCP_SERVER__HOST",
+    "MCP_SERVER__PORT",
+    "AWS_PROFILE",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "AWS_ACCESS_KEY_ID",
+)
 
 def setup_logging():
     """ログ設定をセットアップ"""
@@ -74,6 +109,7 @@ def setup_logging():
     logging.basicConfig(
         level=log_level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%S",
         handlers=[
             logging.StreamHandler(sys.stdout),
             logging.FileHandler("mcp_server.log", encoding="utf-8"),
@@ -86,105 +122,121 @@ def setup_logging():
 
 def check_environment():
     """環境をチェック"""
-    print("🔍 環境をチェックしています...")
+    lines = ["🔍 環境をチェックしています..."]
 
     # Python バージョンチェック
     if sys.version_info < (3, 8):
-        print("❌ Python 3.8以上が必要です")
+        print("\n".join(lines + ["❌ Python 3.8以上が必要です"]))
         sys.exit(1)
 
     # 必要なファイルの存在確認
-    required_files = [
-        "src/mcp/server.py",
-        "src/mcp/config.py",
-        "src/mcp/tools.py",
-        "requirements.txt",
-    ]
-
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            print(f"❌ 必要なファイルが見つかりません: {file_path}")
+    # ディレクトリごとに1回だけ一覧を取得し、その集合で存在を判定
+    listings = {}
+    for file_path in REQUIRED_FILES:
+        directory, name = os.path.split(file_path)
+        if directory not in listings:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    listings[directory] = {entry.name for entry in entries}
+            except OSError:
+                listings[directory] = set()
+        if name not in listings[directory]:
+            lines.append(f"❌ 必要なファイルが見つかりません: {file_path}")
+            print("\n".join(lines))
             sys.exit(1)
 
-    # .envファイルの確認（オプション）
-    if Path(".env").exists():
-        print("✅ .env ファイルが見つかりました")
+    # .envファイルの確認（オプション、起動時の存在確認結果を再利用）
+    if dict(ENV_STATUS).get(".env"):
+        lines.append("✅ .env ファイルが見つかりました")
     else:
-        print("ℹ️  .env ファイルが見つかりません（オプション）")
+        lines.append("ℹ️  .env ファイルが見つかりません（オプション）")
 
-    print("✅ 環境チェック完了")
+    lines.append("✅ 環境チェック完了")
+    print("\n".join(lines))
 
 
 def start_server():
     """サーバーを起動"""
+    # サーバー関連モジュールは環境チェック通過後に読み込む
+    try:
+        from src.mcp.server import CloudWatchMCPServer
+        from src.mcp.config import get_config
+    except ImportError as e:
+        print(f"❌ インポートエラー: {e}")
+        print("必要なモジュールがインストールされていない可能性があります。")
+        print("pip install -r requirements.txt を実行してください。")
+        sys.exit(1)
+
     try:
         print("🚀 CloudWatch Logs MCP Server を起動しています...")
 
-        # 設定を読み込み
-        config = load_config()
+        # 設定を読み込み（プロセス内で一度だけパースしキャッシュ）
+        config = get_config()
 
         # サーバーを作成
         server = CloudWatchMCPServer(config)
 
-        # サーバー情報を表示
+        # サーバー情報を表示（バナーはまとめて1回で出力）
         info = server.get_server_info()
-        print("\n" + "=" * 60)
-        print("🌩️  CloudWatch Logs MCP Server")
-        print("   テスト・開発環境用シンプル版")
-        print("=" * 60)
-        print(f"📋 サーバー名: {info['name']}")
-        print(f"📋 バージョン: {info['version']}")
-        print(f"📋 ツール数: {info['tools_count']}")
-        print(f"📋 トランスポート: {info['transport']}")
+        lines = [
+            "",
+            "=" * 60,
+            "🌩️  CloudWatch Logs MCP Server",
+            "   テスト・開発環境用シンプル版",
+            "=" * 60,
+            f"📋 サーバー名: {info['name']}",
+            f"📋 バージョン: {info['version']}",
+            f"📋 ツール数: {info['tools_count']}",
+            f"📋 トランスポート: {info['transport']}",
+        ]
         if 'host' in info and 'port' in info:
-            print(f"📋 サーバーアドレス: {info['host']}:{info['port']}")
-        print(f"📋 AWS リージョン: {info['config']['aws_region']}")
-        print(f"📋 AWS プロファイル: {info['config']['aws_profile'] or '未設定'}")
-        print(f"📋 キャッシュ: 削除済み (機能を無効化)")
-        print(f"📋 ログレベル: {info['config']['log_level']}")
+            lines.append(f"📋 サーバーアドレス: {info['host']}:{info['port']}")
+        lines += [
+            f"📋 AWS リージョン: {info['config']['aws_region']}",
+            f"📋 AWS プロファイル: {info['config']['aws_profile'] or '未設定'}",
+            "📋 キャッシュ: 削除済み (機能を無効化)",
+            f"📋 ログレベル: {info['config']['log_level']}",
+        ]
 
         # 環境変数の確認
-        print("\n🔍 環境変数の確認:")
-        env_vars = [
-            "MCP_SERVER__TRANSPORT",
-            "MCP_SERVER__HOST",
-            "MCP_SERVER__PORT",
-            "AWS_PROFILE",
-            "AWS_REGION",
-            "AWS_DEFAULT_REGION",
-            "AWS_ACCESS_KEY_ID",
-        ]
-        for var in env_vars:
-            value = os.getenv(var)
+        lines += ["", "🔍 環境変数の確認:"]
+        env_snapshot = {var: os.environ.get(var) for var in DISPLAY_ENV_VARS}
+        for var, value in env_snapshot.items():
             if value:
                 if "KEY" in var:
-                    print(f"   {var}: {'*' * len(value)}")
+                    lines.append(f"   {var}: ****")
                 else:
-                    print(f"   {var}: {value}")
+                    lines.append(f"   {var}: {value}")
             else:
-                print(f"   {var}: 未設定")
+                lines.append(f"   {var}: 未設定")
 
         # 実際のconfig内容を表示
-        print("\n📋 読み込まれた設定:")
-        print(f"   Transport: {config.server.transport.value}")
-        print(f"   Host: {config.server.host}")
-        print(f"   Port: {config.server.port}")
-        print(f"   AWS Profile: {config.aws.profile or '未設定'}")
-        print(f"   AWS Region: {config.aws.region}")
-        print(f"   AWS設定済み: {'はい' if config.aws.is_configured() else 'いいえ'}")
+        lines += [
+            "",
+            "📋 読み込まれた設定:",
+            f"   Transport: {config.server.transport.value}",
+            f"   Host: {config.server.host}",
+            f"   Port: {config.server.port}",
+            f"   AWS Profile: {config.aws.profile or '未設定'}",
+            f"   AWS Region: {config.aws.region}",
+            f"   AWS設定済み: {'はい' if config.aws.is_configured() else 'いいえ'}",
+        ]
 
         # .envファイルの確認
-        env_files = [".env", ".env.local", ".env.mcp"]
-        print("\n📁 .envファイルの確認:")
-        for env_file in env_files:
-            if Path(env_file).exists():
-                print(f"   ✅ {env_file}: 存在")
+        lines += ["", "📁 .envファイルの確認:"]
+        for env_file, exists in ENV_STATUS:
+            if exists:
+                lines.append(f"   ✅ {env_file}: 存在")
             else:
-                print(f"   ❌ {env_file}: なし")
+                lines.append(f"   ❌ {env_file}: なし")
 
-        print("=" * 60)
-        print("🎯 サーバーが起動しました。Ctrl+C で停止できます。")
-        print("=" * 60)
+        lines += [
+            "=" * 60,
+            "🎯 サーバーが起動しました。Ctrl+C で停止できます。",
+            "=" * 60,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
         # サーバーを起動（transport設定を適用）
         # Transport設定に応じてサーバーを起動
@@ -215,24 +267,29 @@ def start_server():
         print("\n🛑 サーバー停止が要求されました")
     except Exception as e:
         print(f"❌ エラーが発生しました: {e}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 
 
 def main():
     """メイン関数"""
-    print("=" * 60)
-    print("🌩️  CloudWatch Logs MCP Server")
-    print("   テスト・開発環境用シンプル版")
-    print("=" * 60)
+    print(
+        "\n".join(
+            (
+                "=" * 60,
+                "🌩️  CloudWatch Logs MCP Server",
+                "   テスト・開発環境用シンプル版",
+                "=" * 60,
+            )
+        )
+    )
 
     # ログ設定
     setup_logging()
 
-    # 環境チェック
-    check_environment()
+    # 環境チェック（--skip-checks / MCP_SKIP_CHECKS=1 で省略）
+    if "--skip-checks" not in sys.argv and not os.getenv("MCP_SKIP_CHECKS"):
+        check_environment()
 
     # サーバー起動
     start_server()
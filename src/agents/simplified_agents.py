@@ -5,20 +5,31 @@ This module implements a simplified agent system using Microsoft AutoGen v0.4's
 AgentChat and Teams patterns for CloudWatch log analysis.
 """
 
+from __future__ import annotations
+
 import os
+import sys
 import json
+import atexit
+import copy
+import functools
+import hashlib
+import math
+import operator
+import time
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any, Sequence
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Any, Sequence
 from datetime import datetime
 
-# AutoGen v0.4 imports
-from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.teams import SelectorGroupChat
-from autogen_agentchat.conditions import TextMentionTermination, MaxMessageTermination
-from autogen_agentchat.ui import Console
-from autogen_ext.models.openai import OpenAIChatCompletionClient
-from autogen_core.tools import FunctionTool
+# AutoGen v0.4, openai and httpx are imported lazily where they are used so
+# importing this module stays cheap until a team is actually built
+if TYPE_CHECKING:
+    import httpx
+    from autogen_core.tools import FunctionTool
 
 # Project imports
 try:
@@ -36,9 +47,14 @@ except ImportError as e1:
         print(f"Second import attempt failed: {e2}")
         print("Warning: Could not import aws_utils. Using fallback implementations.")
 
-        # Create basic CloudWatch tool functions for testing
+        # Create basic CloudWatch tool functions for testing; they share one
+        # preencoded response instead of building a string per call
+        _DUMMY_RESPONSE = sys.intern(
+            json.dumps({"message": "Dummy CloudWatch function - AWS not configured"})
+        )
+
         def list_log_groups_dummy(name_prefix: str = "", limit: int = 50) -> str:
-            return '{"message": "Dummy CloudWatch function - AWS not configured"}'
+            return _DUMMY_RESPONSE
 
         def search_log_events_dummy(
             log_group_name: str,
@@ -46,141 +62,244 @@ except ImportError as e1:
             hours_back: int = 24,
             max_events: int = 100,
         ) -> str:
-            return '{"message": "Dummy CloudWatch function - AWS not configured"}'
+            return _DUMMY_RESPONSE
 
         def get_cloudwatch_tools():
             return [list_log_groups_dummy, search_log_events_dummy]
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-class CloudWatchAgentOrchestrator:
+def to_json(obj: Any, pretty: bool = False) -> str:
     """
-    Orchestrates CloudWatch log investigation using AutoGen v0.4 Teams pattern.
+    Serialize an investigation result or status dict to JSON.
 
-    This class manages four specialized agents:
-    1. PlannerAgent: Task decomposition and delegation
-    2. InstructionAgent: Japanese instruction parsing
-    3. InvestigationAgent: CloudWatch log investigation
-    4. ReportingAgent: Japanese report generation
+    Uses orjson when installed and falls back to the standard library.
+    Output is compact unless ``pretty`` is set.
     """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_json_default
+    )
 
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize the CloudWatch Agent Orchestrator."""
-        self.model_client = None
-        self.cloudwatch_tools = []
-        self.agents = []
-        self.team = None
 
-        # Initialize components
-        self._setup_model_client()
-        self._setup_cloudwatch_tools()
-        self._setup_agents()
-        self._setup_team()
+def _json_default(obj: Any) -> str:
+    """Encode values json cannot handle (datetimes as ISO strings, like orjson)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
 
-    def _setup_model_client(self):
-        """Setup the model client for agents with enhanced provider support."""
-        try:
-            # Priority order for AI providers
-            providers = [
-                ("OPENAI_API_KEY", "openai", "gpt-4o-mini"),
-                ("ANTHROPIC_API_KEY", "anthropic", "claude-3-haiku-20240307"),
-                ("AZURE_OPENAI_API_KEY", "azure", "gpt-4"),
-                ("GOOGLE_API_KEY", "google", "gemini-2.5-flash-preview-05-20"),
-                ("MISTRAL_API_KEY", "mistral", "mistral-medium"),
-            ]
-
-            api_key = None
-            provider_type = None
-            default_model = None
-            # Find the first available API key
-            for key_name, provider, model in providers:
-                api_key = os.getenv(key_name)
-                if api_key:
-                    provider_type = provider
-                    default_model = model
-                    logger.info(
-                        f"Using {provider_type} provider with model {default_model}"
-                    )
-                    break
 
-            if not api_key:
-                logger.warning(
-                    "No AI model API key found. Supported providers: OpenAI, Anthropic, Azure, Google, Mistral. "
-                    "Agent functionality will be limited."
-                )
-                return
+def _isoformat(timestamp: float) -> str:
+    """Format a time.time() value as a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp).isoformat()
 
-            # Create model client based on provider
-            if provider_type == "openai":
-                self.model_client = OpenAIChatCompletionClient(
-                    model=default_model, api_key=api_key
-                )
-            else:
-                # For other providers, try OpenAI-compatible client with different base URL if needed
-                # This is a simplified approach - in production you'd want provider-specific clients
-                try:
-                    self.model_client = OpenAIChatCompletionClient(
-                        model=default_model, api_key=api_key
-                    )
-                except Exception as provider_error:
-                    logger.warning(
-                        f"Failed to setup {provider_type} client: {provider_error}"
-                    )
-                    logger.info("Falling back to basic OpenAI client configuration")
-                    return
 
-            logger.info(f"Model client initialized successfully for {provider_type}")
+# Shared HTTP client for all model clients (keeps TCP/TLS connections warm)
+_http_client: Optional[httpx.AsyncClient] = None
 
-        except Exception as e:
-            logger.error(f"Failed to setup model client: {e}")
-            logger.info("System will continue with limited AI functionality")
-            self.model_client = None
 
-    def _setup_cloudwatch_tools(self) -> List[FunctionTool]:
-        """Setup CloudWatch tools as FunctionTool objects."""
-        tools = []
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared keep-alive HTTP client used for LLM API calls.
 
-        try:
-            # Get tool functions
-            cloudwatch_functions = get_cloudwatch_tools()
-
-            # Convert to FunctionTool objects
-            for func in cloudwatch_functions:
-                tool = FunctionTool(
-                    func,
-                    name=func.__name__,
-                    description=(
-                        func.__doc__.strip()
-                        if func.__doc__
-                        else f"Execute {func.__name__}"
-                    ),
-                )
-                tools.append(tool)
+    Pooled connections belong to the event loop that opened them, so the
+    client is only used on the background loop (see _on_background_loop).
+    """
+    import httpx
+
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        # Sized so the four agents and the selector can fire back to back
+        # without queueing behind the pool
+        limits = httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            # Close idle sockets before load balancers silently drop them
+            keepalive_expiry=30.0,
+        )
+        _http_client = httpx.AsyncClient(
+            limits=limits,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            # Retry failed connection attempts once on a fresh socket
+            transport=httpx.AsyncHTTPTransport(limits=limits, retries=1),
+        )
 
-            logger.info(f"Loaded {len(tools)} CloudWatch tools")
+    return _http_client
 
-        except Exception as e:
-            logger.error(f"Failed to setup CloudWatch tools: {e}")
 
-        self.cloudwatch_tools = tools
-        return tools
+async def aclose_http_client() -> None:
+    """
+    Close the shared HTTP client for process-wide shutdown.
 
-    def _setup_agents(self):
-        """Initialize all specialized agents."""
+    Runs on the background loop that owns the client's connections.
 
-        if not self.model_client:
-            logger.error("Cannot setup agents without model client")
-            return
+    Cached model clients and orchestrators hold the closed client, so they
+    are dropped too; the next orchestrator builds fresh ones. Orchestrators
+    created before the call can no longer reach the model API.
+    """
+    if not _on_background_loop():
+        return await _run_on_background_loop(aclose_http_client())
 
-        # 1. Planner Agent - Task decomposition and delegation
-        planner_agent = AssistantAgent(
-            name="PlannerAgent",
-            description="Task planning and coordination agent. ALWAYS starts first to analyze investigation requests, decompose them into subtasks, and assign work to other agents. Creates the overall investigation strategy for both CloudWatch logs and metrics.",
-            model_client=self.model_client,
-            system_message="""あなたはCloudWatchログ・メトリクス調査のプランナーエージェントです。
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    with _model_clients_lock:
+        _model_clients.clear()
+    with _orchestrators_lock:
+        _orchestrators.clear()
+
+
+# Base URL probed by CloudWatchAgentOrchestrator.warm_up()
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+
+# Bounds applied to every LLM call
+LLM_TIMEOUT_SECONDS = float(os.getenv("AGENT_LLM_TIMEOUT", "60"))
+LLM_MAX_RETRIES = int(os.getenv("AGENT_LLM_MAX_RETRIES", "3"))
+DEFAULT_MAX_OUTPUT_TOKENS = 1024
+
+# Per-agent output token budgets (the report needs the most room)
+AGENT_MAX_OUTPUT_TOKENS = {
+    "PlannerAgent": 1024,
+    "InstructionAgent": 1024,
+    "InvestigationAgent": 2048,
+    "ReportingAgent": 4096,
+}
+
+# Instructions longer than this are truncated before being sent to the team
+MAX_INSTRUCTION_CHARS = 4000
+
+# Investigation workflows: the SelectorGroupChat team, the fixed workflow
+# with concurrent instruction/investigation steps, or a strict agent chain
+WORKFLOW_STRATEGIES = ("selector", "parallel", "linear")
+
+# Maximum number of team conversations an orchestrator and its batch workers
+# run at once; each team itself only ever runs one conversation at a time
+MAX_CONCURRENT_INVESTIGATIONS = int(
+    os.getenv("AGENT_MAX_CONCURRENT_INVESTIGATIONS", "8")
+)
+
+# Lifetime of cached investigation results (0 disables response caching)
+RESPONSE_CACHE_TTL = float(os.getenv("AGENT_RESPONSE_CACHE_TTL", "300"))
+
+# Model clients shared by all orchestrators, keyed by (model, API key hash)
+_model_clients: Dict[tuple, Any] = {}
+_model_clients_lock = threading.Lock()
+
+
+def _get_model_client(
+    model: str, api_key: str, max_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS
+) -> Any:
+    """
+    Get a shared OpenAIChatCompletionClient for a model and API key.
+
+    Reusing the client avoids rebuilding its tokenizer tables and HTTP
+    session for every orchestrator. The cache is keyed by a hash of the
+    API key so raw keys are never stored as dict keys. Every client is
+    bounded by LLM_TIMEOUT_SECONDS, LLM_MAX_RETRIES and ``max_tokens``.
+    """
+    key = (
+        model,
+        hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest(),
+        max_tokens,
+    )
+
+    with _model_clients_lock:
+        client = _model_clients.get(key)
+        if client is None:
+            from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+            client = OpenAIChatCompletionClient(
+                model=model,
+                api_key=api_key,
+                http_client=get_http_client(),
+                timeout=LLM_TIMEOUT_SECONDS,
+                max_retries=LLM_MAX_RETRIES,
+                max_tokens=max_tokens,
+            )
+            _model_clients[key] = client
+
+    return client
+
+
+# Background event loop used by the synchronous investigate() wrapper so that
+# pooled connections survive across calls
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting it on first use."""
+    global _background_loop
+
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="cloudwatch-agent-loop",
+                daemon=True,
+            ).start()
+
+    return _background_loop
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the event loop running in the current thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _on_background_loop() -> bool:
+    """Whether the caller is running on the background event loop."""
+    return _running_loop() is _get_background_loop()
+
+
+async def _run_on_background_loop(coro) -> Any:
+    """
+    Await ``coro`` on the background loop from another event loop.
+
+    The shared HTTP client and the model clients built on it must only be
+    used from the background loop; callers on other loops (for example
+    asyncio.run()) are routed there. Cancelling the caller cancels ``coro``.
+    """
+    return await asyncio.wrap_future(
+        asyncio.run_coroutine_threadsafe(coro, _get_background_loop())
+    )
+
+
+@atexit.register
+def _close_http_client() -> None:
+    """Close the shared HTTP client on interpreter shutdown."""
+    if _http_client is not None and not _http_client.is_closed:
+        try:
+            if _background_loop is not None and _background_loop.is_running():
+                asyncio.run_coroutine_threadsafe(
+                    _http_client.aclose(), _background_loop
+                ).result(timeout=5)
+            else:
+                asyncio.run(_http_client.aclose())
+        except Exception as e:
+            logger.debug(f"Failed to close shared HTTP client: {e}")
+
+
+# Agent system messages (static so they are shared by every orchestrator)
+_PLANNER_SYSTEM_MESSAGE = """あなたはCloudWatchログ・メトリクス調査のプランナーエージェントです。
 
 役割:
 - ユーザーからの調査指示を分析し、適切なサブタスクに分解する
@@ -208,15 +327,9 @@ class CloudWatchAgentOrchestrator:
 1. <エージェント名> : <タスク内容>
 
 すべてのタスクが完了したら、"TERMINATE"で終了してください。
-常に日本語で応答し、明確で実行可能な計画を立ててください。""",
-        )
+常に日本語で応答し、明確で実行可能な計画を立ててください。"""
 
-        # 2. Instruction Agent - Japanese instruction parsing
-        instruction_agent = AssistantAgent(
-            name="InstructionAgent",
-            description="Japanese instruction parser. Works AFTER PlannerAgent to convert natural language instructions into specific CloudWatch query parameters, time ranges, and search conditions for both logs and metrics.",
-            model_client=self.model_client,
-            system_message="""あなたは日本語指示解析の専門エージェントです（ログ・メトリクス両対応）。
+_INSTRUCTION_SYSTEM_MESSAGE = """あなたは日本語指示解析の専門エージェントです（ログ・メトリクス両対応）。
 
 役割:
 - 日本語の調査指示を詳細に解析する
@@ -248,22 +361,16 @@ class CloudWatchAgentOrchestrator:
    - "緊急", "至急" → 高優先度
    - "確認", "調査" → 通常優先度
 
-出力は構造化された調査パラメータとして提供してください。""",
-        )
+出力は構造化された調査パラメータとして提供してください。"""
 
-        # 3. Investigation Agent - CloudWatch log and metrics investigation
-        investigation_agent = AssistantAgent(
-            name="InvestigationAgent",
-            description="CloudWatch investigation executor. Works AFTER InstructionAgent to perform actual log searches and metrics analysis using CloudWatch tools, pattern analysis, and anomaly detection. Has access to all CloudWatch logs and metrics tools.",
-            model_client=self.model_client,
-            tools=self.cloudwatch_tools,
-            system_message="""あなたはCloudWatchログ・メトリクス調査の専門エージェントです。
+_INVESTIGATION_SYSTEM_MESSAGE = """あなたはCloudWatchログ・メトリクス調査の専門エージェントです。
 
 利用可能なツール:
 【ログ調査ツール】
 - list_log_groups: ロググループ一覧取得
 - list_log_streams: ログストリーム一覧取得  
 - search_log_events: ログイベント検索
+- search_log_events_batch: 複数ロググループのログイベントを並列検索
 - get_recent_log_events: 最新ログイベント取得
 - analyze_log_patterns: ログパターン分析
 
@@ -295,18 +402,13 @@ class CloudWatchAgentOrchestrator:
 - ツールの結果はJSON形式で返される
 - エラーハンドリングを適切に行う
 - 大量のデータの場合は段階的に調査する
+- 複数のロググループを検索する場合は search_log_events_batch を使用する
 - 日本語での解釈と説明を提供する
 - メトリクス調査では適切なdimensions（例：FunctionName=test2）を指定する
 
-調査結果は技術的詳細と共に分かりやすく報告してください。""",
-        )
+調査結果は技術的詳細と共に分かりやすく報告してください。"""
 
-        # 4. Reporting Agent - Japanese report generation
-        reporting_agent = AssistantAgent(
-            name="ReportingAgent",
-            description="Japanese report generator. Works LAST after InvestigationAgent to create comprehensive Japanese reports from both log and metrics investigation findings, provide recommendations, and create actionable summaries.",
-            model_client=self.model_client,
-            system_message="""あなたは調査結果レポート作成の専門エージェントです（ログ・メトリクス両対応）。
+_REPORTING_SYSTEM_MESSAGE = """あなたは調査結果レポート作成の専門エージェントです（ログ・メトリクス両対応）。
 
 レポート構成:
 1. 調査概要
@@ -348,7 +450,350 @@ class CloudWatchAgentOrchestrator:
 - 緊急度に応じた推奨事項
 - アクションアイテムの明確化
 
-常に日本語で、読みやすく構造化されたレポートを作成してください。""",
+常に日本語で、読みやすく構造化されたレポートを作成してください。"""
+
+
+# Extracts (source, content) from team messages in one C-level call
+_source_and_content = operator.attrgetter("source", "content")
+
+# Maximum number of messages in one team conversation
+MAX_TEAM_MESSAGES = 25
+
+# Priority order for AI providers: (API key env var, provider, default model)
+_PROVIDERS = (
+    ("OPENAI_API_KEY", "openai", "gpt-4o-mini"),
+    ("ANTHROPIC_API_KEY", "anthropic", "claude-3-haiku-20240307"),
+    ("AZURE_OPENAI_API_KEY", "azure", "gpt-4"),
+    ("GOOGLE_API_KEY", "google", "gemini-2.5-flash-preview-05-20"),
+    ("MISTRAL_API_KEY", "mistral", "mistral-medium"),
+)
+
+# Static task preamble; must not contain per-run values (timestamps, IDs)
+_TASK_PREFIX = """
+CloudWatchログ・メトリクス調査を開始します。
+
+チームメンバー:
+- PlannerAgent: タスク分解と計画立案
+- InstructionAgent: 指示の詳細解析（ログ・メトリクス両対応）
+- InvestigationAgent: CloudWatchログ・メトリクスの実際の調査
+- ReportingAgent: 結果レポートの作成（ログ・メトリクス統合）
+
+調査指示: """
+
+
+@functools.lru_cache(maxsize=1)
+def _build_cloudwatch_tools() -> tuple:
+    """Wrap CloudWatch functions as FunctionTool objects (built once per process)."""
+    from autogen_core.tools import FunctionTool
+
+    return tuple(
+        FunctionTool(
+            func,
+            name=func.__name__,
+            description=(
+                func.__doc__.strip() if func.__doc__ else f"Execute {func.__name__}"
+            ),
+        )
+        for func in get_cloudwatch_tools()
+    )
+
+
+class SemanticResponseCache:
+    """
+    Cache investigation results keyed on instruction embeddings.
+
+    A lookup hits when a cached instruction's embedding has cosine
+    similarity at or above ``threshold`` and the entry is younger than
+    ``ttl_seconds`` (log data ages quickly, so entries expire fast).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        threshold: float = 0.92,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 64,
+    ):
+        self.api_key = api_key
+        self.model = model
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # (created_at, strategy, embedding, norm, result)
+        self._entries: List[tuple] = []
+
+    async def embed(self, text: str) -> List[float]:
+        """Compute the embedding for an instruction."""
+        from openai import AsyncOpenAI
+
+        client = AsyncOpenAI(api_key=self.api_key, http_client=get_http_client())
+        response = await client.embeddings.create(model=self.model, input=text)
+        return response.data[0].embedding
+
+    def lookup(
+        self, embedding: List[float], strategy: str = "selector"
+    ) -> Optional[Dict[str, Any]]:
+        """Return a copy of the most similar fresh result for ``strategy``, if any."""
+        now = time.monotonic()
+        self._entries = [
+            entry for entry in self._entries if now - entry[0] < self.ttl_seconds
+        ]
+
+        norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+        best_score = 0.0
+        best_result = None
+        for _, cached_strategy, cached_embedding, cached_norm, result in self._entries:
+            if cached_strategy != strategy:
+                continue
+            score = sum(a * b for a, b in zip(embedding, cached_embedding)) / (
+                norm * cached_norm
+            )
+            if score > best_score:
+                best_score = score
+                best_result = result
+
+        if best_result is not None and best_score >= self.threshold:
+            return copy.deepcopy(best_result)
+        return None
+
+    def store(
+        self, embedding: List[float], result: Dict[str, Any], strategy: str = "selector"
+    ) -> None:
+        """Store a copy of a completed investigation result."""
+        norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+        self._entries.append(
+            (time.monotonic(), strategy, embedding, norm, copy.deepcopy(result))
+        )
+        if len(self._entries) > self.max_entries:
+            del self._entries[0]
+
+
+@dataclass
+class InvestigationResult:
+    """Completed investigation accumulated on the hot path."""
+
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "instruction",
+        "timestamp",
+        "completed_at",
+        "duration_seconds",
+        "messages",
+        "agent_interactions",
+        "summary",
+        "status",
+    )
+
+    instruction: str
+    timestamp: str
+    completed_at: str
+    duration_seconds: float
+    messages: List[Dict[str, Any]]
+    agent_interactions: Counter
+    summary: str
+    status: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the investigation result dictionary."""
+        return {
+            "instruction": self.instruction,
+            "timestamp": self.timestamp,
+            "completed_at": self.completed_at,
+            "duration_seconds": self.duration_seconds,
+            "messages": self.messages,
+            "agent_interactions": dict(self.agent_interactions),
+            "summary": self.summary,
+            "status": self.status,
+        }
+
+
+class InstructionResponseCache:
+    """
+    LRU cache of completed investigations keyed by normalized instruction.
+
+    Catches exact repeats (ignoring case and surrounding whitespace) for
+    every provider, without the embedding call SemanticResponseCache needs.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 128):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    @staticmethod
+    def key(instruction: str, strategy: str = "selector") -> str:
+        """Normalize and hash an instruction and workflow into a cache key."""
+        normalized = f"{strategy}\0{instruction.strip().lower()}"
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached result, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a copy of a completed investigation result."""
+        self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class CloudWatchAgentOrchestrator:
+    """
+    Orchestrates CloudWatch log investigation using AutoGen v0.4 Teams pattern.
+
+    This class manages four specialized agents:
+    1. PlannerAgent: Task decomposition and delegation
+    2. InstructionAgent: Japanese instruction parsing
+    3. InvestigationAgent: CloudWatch log investigation
+    4. ReportingAgent: Japanese report generation
+    """
+
+    def __init__(self, config_path: Optional[str] = None):
+        """Initialize the CloudWatch Agent Orchestrator."""
+        self.model_client = None
+        self._model_client_args: Optional[tuple] = None
+        self.cloudwatch_tools = []
+        self.agents = []
+        self._static_status: Dict[str, Any] = {"total_agents": 0, "agents": ()}
+        self.team = None
+        self._team_lock: Optional[asyncio.Lock] = None
+        self._investigation_semaphore: Optional[asyncio.Semaphore] = None
+        self.response_cache: Optional[SemanticResponseCache] = None
+        self.instruction_cache: Optional[InstructionResponseCache] = (
+            InstructionResponseCache(ttl_seconds=RESPONSE_CACHE_TTL)
+            if RESPONSE_CACHE_TTL > 0
+            else None
+        )
+
+        # Initialize components
+        self._setup_model_client()
+        self._setup_cloudwatch_tools()
+        self._setup_agents()
+        self._setup_team()
+
+    def _setup_model_client(self):
+        """Setup the model client for agents with enhanced provider support."""
+        try:
+            # Find the first available (non-empty) API key
+            environ = os.environ
+            api_key, provider_type, default_model = next(
+                (
+                    (environ[key_name], provider, model)
+                    for key_name, provider, model in _PROVIDERS
+                    if environ.get(key_name)
+                ),
+                (None, None, None),
+            )
+
+            if not api_key:
+                logger.warning(
+                    "No AI model API key found. Supported providers: OpenAI, Anthropic, Azure, Google, Mistral. "
+                    "Agent functionality will be limited."
+                )
+                return
+            logger.info(f"Using {provider_type} provider with model {default_model}")
+
+            # Create model client based on provider
+            if provider_type == "openai":
+                self.model_client = _get_model_client(default_model, api_key)
+                self._model_client_args = (default_model, api_key)
+                # Embedding-based response cache (OpenAI embeddings API only)
+                if RESPONSE_CACHE_TTL > 0:
+                    self.response_cache = SemanticResponseCache(
+                        api_key, ttl_seconds=RESPONSE_CACHE_TTL
+                    )
+            else:
+                # For other providers, try OpenAI-compatible client with different base URL if needed
+                # This is a simplified approach - in production you'd want provider-specific clients
+                try:
+                    self.model_client = _get_model_client(default_model, api_key)
+                    self._model_client_args = (default_model, api_key)
+                except Exception as provider_error:
+                    logger.warning(
+                        f"Failed to setup {provider_type} client: {provider_error}"
+                    )
+                    logger.info("Falling back to basic OpenAI client configuration")
+                    return
+
+            logger.info(f"Model client initialized successfully for {provider_type}")
+
+        except Exception as e:
+            logger.error(f"Failed to setup model client: {e}")
+            logger.info("System will continue with limited AI functionality")
+            self.model_client = None
+
+    def _agent_model_client(self, agent_name: str) -> Any:
+        """Get the model client for an agent, sized to its output token budget."""
+        model, api_key = self._model_client_args
+        return _get_model_client(
+            model,
+            api_key,
+            AGENT_MAX_OUTPUT_TOKENS.get(agent_name, DEFAULT_MAX_OUTPUT_TOKENS),
+        )
+
+    def _setup_cloudwatch_tools(self) -> List[FunctionTool]:
+        """Setup CloudWatch tools as FunctionTool objects."""
+        tools = []
+
+        try:
+            tools = list(_build_cloudwatch_tools())
+            logger.info(f"Loaded {len(tools)} CloudWatch tools")
+
+        except Exception as e:
+            logger.error(f"Failed to setup CloudWatch tools: {e}")
+
+        self.cloudwatch_tools = tools
+        return tools
+
+    def _setup_agents(self):
+        """Initialize all specialized agents."""
+
+        if not self.model_client:
+            logger.error("Cannot setup agents without model client")
+            return
+
+        from autogen_agentchat.agents import AssistantAgent
+
+        # 1. Planner Agent - Task decomposition and delegation
+        planner_agent = AssistantAgent(
+            name="PlannerAgent",
+            description="Task planning and coordination agent. ALWAYS starts first to analyze investigation requests, decompose them into subtasks, and assign work to other agents. Creates the overall investigation strategy for both CloudWatch logs and metrics.",
+            model_client=self._agent_model_client("PlannerAgent"),
+            system_message=_PLANNER_SYSTEM_MESSAGE,
+        )
+
+        # 2. Instruction Agent - Japanese instruction parsing
+        instruction_agent = AssistantAgent(
+            name="InstructionAgent",
+            description="Japanese instruction parser. Works AFTER PlannerAgent to convert natural language instructions into specific CloudWatch query parameters, time ranges, and search conditions for both logs and metrics.",
+            model_client=self._agent_model_client("InstructionAgent"),
+            system_message=_INSTRUCTION_SYSTEM_MESSAGE,
+        )
+
+        # 3. Investigation Agent - CloudWatch log and metrics investigation
+        investigation_agent = AssistantAgent(
+            name="InvestigationAgent",
+            description="CloudWatch investigation executor. Works AFTER InstructionAgent to perform actual log searches and metrics analysis using CloudWatch tools, pattern analysis, and anomaly detection. Has access to all CloudWatch logs and metrics tools.",
+            model_client=self._agent_model_client("InvestigationAgent"),
+            tools=self.cloudwatch_tools,
+            system_message=_INVESTIGATION_SYSTEM_MESSAGE,
+        )
+
+        # 4. Reporting Agent - Japanese report generation
+        reporting_agent = AssistantAgent(
+            name="ReportingAgent",
+            description="Japanese report generator. Works LAST after InvestigationAgent to create comprehensive Japanese reports from both log and metrics investigation findings, provide recommendations, and create actionable summaries.",
+            model_client=self._agent_model_client("ReportingAgent"),
+            system_message=_REPORTING_SYSTEM_MESSAGE,
         )
 
         # Store agents
@@ -358,6 +803,14 @@ class CloudWatchAgentOrchestrator:
             investigation_agent,
             reporting_agent,
         ]
+        # Agent names and descriptions never change after setup
+        self._static_status = {
+            "total_agents": len(self.agents),
+            "agents": tuple(
+                {"name": agent.name, "description": agent.description}
+                for agent in self.agents
+            ),
+        }
 
         logger.info(f"Initialized {len(self.agents)} agents")
 
@@ -373,14 +826,17 @@ class CloudWatchAgentOrchestrator:
             return
 
         try:
-            # Create multiple termination conditions for better control
-            termination_conditions = [
-                TextMentionTermination("TERMINATE"),
-                TextMentionTermination("終了"),
-                TextMentionTermination("完了"),
-            ]
-            max_messages_termination = MaxMessageTermination(max_messages=25)
-            termination = termination_conditions[0] | max_messages_termination
+            from autogen_agentchat.conditions import (
+                MaxMessageTermination,
+                TextMentionTermination,
+            )
+            from autogen_agentchat.teams import SelectorGroupChat
+
+            # Stop on an explicit TERMINATE or after the message budget.
+            # Conditions are stateful, so each team gets its own instances.
+            termination = TextMentionTermination(
+                "TERMINATE"
+            ) | MaxMessageTermination(max_messages=MAX_TEAM_MESSAGES)
             # Custom selector prompt for workflow alignment
             #           selector_prompt = """Select an agent to perform task.
 
@@ -418,23 +874,167 @@ class CloudWatchAgentOrchestrator:
             logger.error(f"Failed to setup team: {e}")
             self.team = None
 
-    async def investigate_async(self, instruction: str) -> Dict[str, Any]:
+    async def __aenter__(self) -> CloudWatchAgentOrchestrator:
+        await self.warm_up()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the model API ahead of the first call."""
+        if not self.model_client:
+            return
+        if not _on_background_loop():
+            return await _run_on_background_loop(self.warm_up())
+        try:
+            await get_http_client().head(OPENAI_BASE_URL)
+        except Exception as e:
+            logger.debug(f"HTTP client warm-up failed: {e}")
+
+    async def aclose(self) -> None:
+        """
+        Release this orchestrator's conversation state.
+
+        The HTTP client and model clients are shared with every other
+        orchestrator, so they stay open; they are closed at interpreter exit
+        or explicitly through aclose_http_client().
+        """
+        if self.team is None:
+            return
+        if not _on_background_loop():
+            return await _run_on_background_loop(self.aclose())
+        try:
+            async with self._team_run_lock():
+                await self.team.reset()
+        except Exception as e:
+            logger.debug(f"Failed to reset team on close: {e}")
+
+    async def _run_parallel_workflow(self, task: str) -> AsyncIterator[Any]:
+        """
+        Run the agents as a fixed workflow, yielding messages as they arrive.
+
+        The planner runs first; the instruction and investigation agents
+        then run concurrently on the plan, and the reporting agent
+        summarizes both. This skips the selector's model call per turn.
+        """
+        from autogen_agentchat.messages import TextMessage
+        from autogen_core import CancellationToken
+
+        planner, instruction_agent, investigation_agent, reporting_agent = self.agents
+        cancellation_token = CancellationToken()
+        for agent in self.agents:
+            await agent.on_reset(cancellation_token)
+
+        task_message = TextMessage(content=task, source="user")
+        yield task_message
+
+        planner_response = await planner.on_messages(
+            [task_message], cancellation_token
+        )
+        for message in planner_response.inner_messages or ():
+            yield message
+        yield planner_response.chat_message
+
+        plan = [task_message, planner_response.chat_message]
+        instruction_response, investigation_response = await asyncio.gather(
+            instruction_agent.on_messages(plan, cancellation_token),
+            investigation_agent.on_messages(plan, cancellation_token),
+        )
+        for response in (instruction_response, investigation_response):
+            for message in response.inner_messages or ():
+                yield message
+            yield response.chat_message
+
+        reporting_response = await reporting_agent.on_messages(
+            [instruction_response.chat_message, investigation_response.chat_message],
+            cancellation_token,
+        )
+        for message in reporting_response.inner_messages or ():
+            yield message
+        yield reporting_response.chat_message
+
+    async def _run_linear_workflow(self, task: str) -> AsyncIterator[Any]:
+        """
+        Run the agents strictly in order, yielding messages as they arrive.
+
+        Each agent sees the task and every earlier agent's reply, so the
+        planner -> instruction -> investigation -> reporting chain needs no
+        selector model call between turns.
+        """
+        from autogen_agentchat.messages import TextMessage
+        from autogen_core import CancellationToken
+
+        cancellation_token = CancellationToken()
+        for agent in self.agents:
+            await agent.on_reset(cancellation_token)
+
+        task_message = TextMessage(content=task, source="user")
+        yield task_message
+
+        transcript = [task_message]
+        for agent in self.agents:
+            response = await agent.on_messages(list(transcript), cancellation_token)
+            for message in response.inner_messages or ():
+                yield message
+            yield response.chat_message
+            transcript.append(response.chat_message)
+
+    def _team_run_lock(self) -> asyncio.Lock:
+        """Get the lock serializing conversations on this orchestrator's team."""
+        # Created lazily so it binds to the loop that actually runs the team
+        if self._team_lock is None:
+            self._team_lock = asyncio.Lock()
+        return self._team_lock
+
+    def _investigation_slots(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding concurrent runs across batch workers.
+
+        Workers share it but own separate teams; runs on a single team are
+        serialized by _team_run_lock() instead.
+        """
+        # Created lazily so it binds to the loop that actually runs the team
+        if self._investigation_semaphore is None:
+            self._investigation_semaphore = asyncio.Semaphore(
+                max(1, MAX_CONCURRENT_INVESTIGATIONS)
+            )
+        return self._investigation_semaphore
+
+    async def investigate_async(
+        self, instruction: str, parallel: bool = False, strategy: str = "selector"
+    ) -> Dict[str, Any]:
         """
         Execute CloudWatch log investigation based on Japanese instruction.
 
+        The run always executes on the background loop that owns the shared
+        HTTP client; awaiting from another loop is routed there.
+
         Args:
             instruction: Japanese investigation instruction
+            parallel: Shortcut for ``strategy="parallel"``
+            strategy: Workflow to run, one of WORKFLOW_STRATEGIES:
+                "selector" uses the SelectorGroupChat team, "parallel" runs
+                planner -> (instruction | investigation) -> reporting and
+                "linear" runs the agents one after another
 
         Returns:
             Investigation results and report with enhanced error handling
         """
-        investigation_start = datetime.now()
+        if not _on_background_loop():
+            return await _run_on_background_loop(
+                self.investigate_async(instruction, parallel=parallel, strategy=strategy)
+            )
+
+        # Wall-clock start for reporting; monotonic clock for durations
+        start_wall = time.time()
+        start_monotonic = time.monotonic()
 
         # Pre-flight checks
         if not self.team:
             return {
                 "instruction": instruction,
-                "timestamp": investigation_start.isoformat(),
+                "timestamp": _isoformat(start_wall),
                 "error": "Team not properly initialized. Please check API keys and configuration.",
                 "status": "failed",
                 "agent_status": self.get_agent_status(),
@@ -443,79 +1043,141 @@ class CloudWatchAgentOrchestrator:
         if not instruction or not instruction.strip():
             return {
                 "instruction": instruction,
-                "timestamp": investigation_start.isoformat(),
+                "timestamp": _isoformat(start_wall),
                 "error": "Empty or invalid instruction provided",
                 "status": "failed",
             }
 
+        if parallel:
+            strategy = "parallel"
+        if strategy not in WORKFLOW_STRATEGIES:
+            return {
+                "instruction": instruction,
+                "timestamp": _isoformat(start_wall),
+                "error": f"Unknown workflow strategy: {strategy}. "
+                f"Supported: {', '.join(WORKFLOW_STRATEGIES)}",
+                "status": "failed",
+            }
+
         try:
             logger.info(
                 f"Starting investigation: {instruction[:100]}{'...' if len(instruction) > 100 else ''}"
             )
 
-            # Enhance instruction with context
-            enhanced_instruction = f"""
-CloudWatchログ・メトリクス調査を開始します。
-
-調査指示: {instruction}
-
-チームメンバー:
-- PlannerAgent: タスク分解と計画立案
-- InstructionAgent: 指示の詳細解析（ログ・メトリクス両対応）
-- InvestigationAgent: CloudWatchログ・メトリクスの実際の調査
-- ReportingAgent: 結果レポートの作成（ログ・メトリクス統合）
-
-"""
+            # Return a recent result for the same normalized instruction
+            cache_key = None
+            if self.instruction_cache is not None:
+                cache_key = self.instruction_cache.key(instruction, strategy)
+                cached = self.instruction_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Returning cached investigation result")
+                    return {**cached, "status": "cached"}
+
+            # Return a recent result for a semantically equivalent instruction
+            instruction_embedding = None
+            if self.response_cache is not None:
+                try:
+                    instruction_embedding = await self.response_cache.embed(
+                        instruction
+                    )
+                    cached = self.response_cache.lookup(
+                        instruction_embedding, strategy
+                    )
+                    if cached is not None:
+                        logger.info("Returning cached investigation result")
+                        return {**cached, "status": "cached"}
+                except Exception as e:
+                    logger.warning(f"Response cache lookup failed: {e}")
+
+            # Enhance instruction with context. The static preamble comes first
+            # and the instruction last so provider prompt caching can reuse
+            # the shared prefix across investigations.
+            # Guard the input token budget against oversized instructions
+            task_instruction = instruction
+            if len(task_instruction) > MAX_INSTRUCTION_CHARS:
+                logger.warning(
+                    f"Instruction truncated from {len(task_instruction)} to "
+                    f"{MAX_INSTRUCTION_CHARS} characters"
+                )
+                task_instruction = task_instruction[:MAX_INSTRUCTION_CHARS]
+            enhanced_instruction = _TASK_PREFIX + task_instruction + "\n"
 
             # Run the team conversation with timeout handling
             try:
-                # Use the correct Console API for AutoGen
-                result = await Console(
-                    self.team.run_stream(task=enhanced_instruction),
-                    output_stats=True,  # Enable stats printing
+                from autogen_agentchat.base import TaskResult
+
+                # Consume the team stream directly, structuring each message as
+                # it arrives instead of buffering the transcript first
+                messages = []
+                agent_interactions = Counter()
+                result = None
+                # The team and its agents hold conversation state, so runs on
+                # them are serialized and each starts from a clean team
+                async with self._team_run_lock(), self._investigation_slots():
+                    if strategy == "parallel":
+                        stream = self._run_parallel_workflow(enhanced_instruction)
+                    elif strategy == "linear":
+                        stream = self._run_linear_workflow(enhanced_instruction)
+                    else:
+                        await self.team.reset()
+                        stream = self.team.run_stream(task=enhanced_instruction)
+                    async for item in stream:
+                        if isinstance(item, TaskResult):
+                            result = item
+                            continue
+
+                        # AutoGen messages and events all carry source and content;
+                        # fall back to attribute probes only for unexpected items
+                        try:
+                            agent_name, content = _source_and_content(item)
+                        except AttributeError:
+                            agent_name = getattr(item, "source", "unknown")
+                            content = getattr(item, "content", item)
+                        if not isinstance(content, str):
+                            content = str(content)
+                        messages.append(
+                            {
+                                "agent": agent_name,
+                                "content": content,
+                                "timestamp": getattr(item, "timestamp", None),
+                            }
+                        )
+
+                        # Count interactions per agent
+                        agent_interactions[agent_name] += 1
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Team result: %r", result)
+                logger.info(
+                    "Team stream finished: %d messages (%s), stop reason: %s",
+                    len(messages),
+                    ", ".join(f"{k}={v}" for k, v in agent_interactions.items()),
+                    getattr(result, "stop_reason", None),
                 )
-                print(result)
 
-                investigation_end = datetime.now()
-                duration = (investigation_end - investigation_start).total_seconds()
+                duration = time.monotonic() - start_monotonic
 
                 # Extract and structure results
-                investigation_result = {
-                    "instruction": instruction,
-                    "timestamp": investigation_start.isoformat(),
-                    "completed_at": investigation_end.isoformat(),
-                    "duration_seconds": duration,
-                    "messages": [],
-                    "agent_interactions": {},
-                    "summary": "Investigation completed successfully",
-                    "status": "completed",
-                }
-
-                # Process result messages if available
-                if hasattr(result, "messages") and result.messages:
-                    investigation_result["messages"] = [
-                        {
-                            "agent": getattr(msg, "source", "unknown"),
-                            "content": (
-                                str(msg.content)
-                                if hasattr(msg, "content")
-                                else str(msg)
-                            ),
-                            "timestamp": getattr(msg, "timestamp", None),
-                        }
-                        for msg in result.messages
-                    ]
-
-                    # Count interactions per agent
-                    for msg in investigation_result["messages"]:
-                        agent_name = msg["agent"]
-                        if agent_name not in investigation_result["agent_interactions"]:
-                            investigation_result["agent_interactions"][agent_name] = 0
-                        investigation_result["agent_interactions"][agent_name] += 1
-
+                if messages:
+                    summary = "Investigation completed successfully"
                 else:
-                    investigation_result["summary"] = (
-                        str(result) if result else "No detailed result available"
+                    summary = str(result) if result else "No detailed result available"
+                investigation_result = InvestigationResult(
+                    instruction=instruction,
+                    timestamp=_isoformat(start_wall),
+                    completed_at=_isoformat(start_wall + duration),
+                    duration_seconds=duration,
+                    messages=messages,
+                    agent_interactions=agent_interactions,
+                    summary=summary,
+                    status="completed",
+                ).to_dict()
+
+                if cache_key is not None:
+                    self.instruction_cache.put(cache_key, investigation_result)
+                if instruction_embedding is not None:
+                    self.response_cache.store(
+                        instruction_embedding, investigation_result, strategy
                     )
 
                 logger.info(
@@ -526,23 +1188,20 @@ CloudWatchログ・メトリクス調査を開始します。
             except asyncio.TimeoutError:
                 return {
                     "instruction": instruction,
-                    "timestamp": investigation_start.isoformat(),
+                    "timestamp": _isoformat(start_wall),
                     "error": "Investigation timed out. Consider breaking down the request into smaller parts.",
                     "status": "timeout",
-                    "duration_seconds": (
-                        datetime.now() - investigation_start
-                    ).total_seconds(),
+                    "duration_seconds": time.monotonic() - start_monotonic,
                 }
 
         except Exception as e:
-            investigation_end = datetime.now()
-            duration = (investigation_end - investigation_start).total_seconds()
+            duration = time.monotonic() - start_monotonic
 
             logger.error(f"Investigation failed after {duration:.2f} seconds: {e}")
             return {
                 "instruction": instruction,
-                "timestamp": investigation_start.isoformat(),
-                "completed_at": investigation_end.isoformat(),
+                "timestamp": _isoformat(start_wall),
+                "completed_at": _isoformat(start_wall + duration),
                 "duration_seconds": duration,
                 "error": str(e),
                 "error_type": type(e).__name__,
@@ -554,26 +1213,78 @@ CloudWatchログ・メトリクス調査を開始します。
                 },
             }
 
-    def investigate(self, instruction: str) -> Dict[str, Any]:
+    async def investigate_batch_async(
+        self, instructions: Sequence[str], concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several independent investigations concurrently.
+
+        A team can only run one conversation at a time, so each instruction
+        runs on a worker that shares this orchestrator's model client, tools
+        and response cache but has its own agents and team.
+
+        Args:
+            instructions: Japanese investigation instructions
+            concurrency: Maximum number of investigations running at once
+
+        Returns:
+            Investigation results in the same order as ``instructions``
+        """
+        if not _on_background_loop():
+            return await _run_on_background_loop(
+                self.investigate_batch_async(instructions, concurrency)
+            )
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        # Workers are shallow copies; create the run limit first so they share it
+        self._investigation_slots()
+
+        async def _run_one(instruction: str) -> Dict[str, Any]:
+            async with semaphore:
+                worker = copy.copy(self)
+                worker._team_lock = None
+                worker._setup_agents()
+                worker._setup_team()
+                return await worker.investigate_async(instruction)
+
+        return list(await asyncio.gather(*(_run_one(i) for i in instructions)))
+
+    def investigate(
+        self, instruction: str, parallel: bool = False, strategy: str = "selector"
+    ) -> Dict[str, Any]:
         """
         Synchronous wrapper for investigate_async.
 
         Args:
             instruction: Japanese investigation instruction
+            parallel: Shortcut for ``strategy="parallel"``
+            strategy: Workflow to run (see investigate_async)
 
         Returns:
             Investigation results and report
         """
         try:
-            # Run async investigation
-            result = asyncio.run(self.investigate_async(instruction))
-            return result
+            # Run async investigation on the long-lived background loop
+            loop = _get_background_loop()
+            if _running_loop() is loop:
+                # Blocking on the loop from inside itself would deadlock
+                raise RuntimeError(
+                    "investigate() cannot be called from the agent event loop; "
+                    "await investigate_async() instead"
+                )
+            future = asyncio.run_coroutine_threadsafe(
+                self.investigate_async(
+                    instruction, parallel=parallel, strategy=strategy
+                ),
+                loop,
+            )
+            return future.result()
 
         except Exception as e:
             logger.error(f"Synchronous investigation failed: {e}")
             return {
                 "instruction": instruction,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _isoformat(time.time()),
                 "error": str(e),
                 "status": "failed",
             }
@@ -581,46 +1292,58 @@ CloudWatchログ・メトリクス調査を開始します。
     def get_agent_status(self) -> Dict[str, Any]:
         """Get status of all agents."""
         return {
-            "total_agents": len(self.agents),
+            **self._static_status,
             "cloudwatch_tools": len(self.cloudwatch_tools),
             "model_client_ready": self.model_client is not None,
             "team_ready": self.team is not None,
-            "agents": [
-                {"name": agent.name, "description": agent.description}
-                for agent in self.agents
-            ],
         }
 
 
+# Cached orchestrators keyed by config path
+_orchestrators: Dict[Optional[str], "CloudWatchAgentOrchestrator"] = {}
+_orchestrators_lock = threading.Lock()
+
+
 def create_cloudwatch_orchestrator(
     config_path: Optional[str] = None,
 ) -> CloudWatchAgentOrchestrator:
     """
     Factory function to create CloudWatch agent orchestrator.
 
+    Fully initialized orchestrators are cached per config path and reused
+    by subsequent calls. Investigations on a shared orchestrator run one at
+    a time, each on a freshly reset team; use investigate_batch_async for
+    concurrent runs. Orchestrators whose team is not ready are not cached,
+    so a later call can pick up newly configured API keys.
+
     Args:
         config_path: Optional path to configuration file
 
     Returns:
         Configured CloudWatchAgentOrchestrator instance
     """
-    try:
-        orchestrator = CloudWatchAgentOrchestrator(config_path)
+    with _orchestrators_lock:
+        cached = _orchestrators.get(config_path)
+        if cached is not None:
+            return cached
 
-        # Verify initialization
-        status = orchestrator.get_agent_status()
+        try:
+            orchestrator = CloudWatchAgentOrchestrator(config_path)
 
-        if not status["model_client_ready"]:
-            logger.warning("Model client not ready - check API keys")
+            # Verify initialization
+            if orchestrator.model_client is None:
+                logger.warning("Model client not ready - check API keys")
 
-        if not status["team_ready"]:
-            logger.warning("Team not ready - check configuration")
+            if orchestrator.team is None:
+                logger.warning("Team not ready - check configuration")
+            else:
+                _orchestrators[config_path] = orchestrator
 
-        return orchestrator
+            return orchestrator
 
-    except Exception as e:
-        logger.error(f"Failed to create orchestrator: {e}")
-        raise
+        except Exception as e:
+            logger.error(f"Failed to create orchestrator: {e}")
+            raise
 
 
 # Example usage
@@ -636,10 +1359,10 @@ if __name__ == "__main__":
 
     # Check status
     status = orchestrator.get_agent_status()
-    print(json.dumps(status, ensure_ascii=False, indent=2))
+    print(to_json(status, pretty="--pretty" in sys.argv))
 
     # Example investigation (commented out to avoid requiring API keys)
     # result = orchestrator.investigate(
     #     "Lambdaファンクションでエラーが発生しています。過去1時間のログを調査してください。"
     # )
-    # print(json.dumps(result, ensure_ascii=False, indent=2))
+    # print(to_json(result, pretty="--pretty" in sys.argv))
@@ -14,12 +14,112 @@ External environment variables are never overridden by .env files.
 """
 
 import os
+import re
+import functools
 import logging
 from pathlib import Path
-from typing import Dict, Optional, List, Union
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# KEY=value line in a .env file; the value may be wrapped in matching quotes
+_ENV_LINE = re.compile(
+    r"""^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"(.*)"|'(.*)'|(.*?))\s*$"""
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_project_root(start: Path) -> Path:
+    """
+    Find the project root by looking for common files above ``start``.
+
+    Cached so repeated loader construction does not re-stat every parent.
+    """
+    current_dir = start
+    while current_dir != current_dir.parent:
+        if (current_dir / ".env.cloudwatch").exists() or (
+            current_dir / "requirements.txt"
+        ).exists():
+            return current_dir
+        current_dir = current_dir.parent
+    return Path.cwd()
+
+
+# AI provider API keys; at least one must be set
+_AI_KEYS = (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "AZURE_OPENAI_API_KEY",
+    "GOOGLE_API_KEY",
+)
+
+# Default validation: result name -> variables of which at least one must be set
+_DEFAULT_REQUIRED_VARS = MappingProxyType(
+    {
+        "AWS_REGION": ("AWS_DEFAULT_REGION", "AWS_REGION"),
+        "AI_API_KEY": _AI_KEYS,
+    }
+)
+
+# Prefixes of system variables included by export_current_env
+_EXPORT_PREFIXES = ("AWS_", "OPENAI_", "ANTHROPIC_", "LOG_")
+
+# Parsed .env files: path -> (mtime_ns, size, {key: value})
+_PARSE_CACHE: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+
+
+def _parse_env_file(file_path: str) -> Dict[str, str]:
+    """
+    Parse a .env file into key/value pairs.
+
+    Results are cached by path and reused while the file's mtime and size
+    are unchanged, so reloads skip reading and parsing unchanged files.
+    """
+    stat = os.stat(file_path)
+    cache_key = file_path
+    cached = _PARSE_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    # Read the whole file in one call and split it in C
+    with open(file_path, "r", encoding="utf-8", buffering=65536) as f:
+        data = f.read()
+
+    values: Dict[str, str] = {}
+    bad_lines: List[int] = []
+    for line_num, line in enumerate(data.splitlines(), 1):
+        # Skip empty lines and comments
+        stripped = line.lstrip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        # Parse key=value pairs (quotes removed by the pattern)
+        match = _ENV_LINE.match(line)
+        if match is None:
+            bad_lines.append(line_num)
+            continue
+
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            values[key] = double_quoted
+        elif single_quoted is not None:
+            values[key] = single_quoted
+        else:
+            values[key] = bare
+
+    # Report all malformed lines at once
+    if bad_lines and logger.isEnabledFor(logging.WARNING):
+        logger.warning("Invalid lines in %s: %s", file_path, bad_lines)
+
+    _PARSE_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, values)
+    return values
+
+
+def _quote_env_value(value: str) -> str:
+    """Quote values with spaces for .env output."""
+    return f'"{value}"' if " " in value else value
+
 
 class EnvLoader:
     """
@@ -35,20 +135,13 @@ class EnvLoader:
         """
         if project_root is None:
             # Auto-detect project root by looking for common files
-            current_dir = Path(__file__).parent
-            while current_dir != current_dir.parent:
-                if (current_dir / ".env.cloudwatch").exists() or (
-                    current_dir / "requirements.txt"
-                ).exists():
-                    project_root = current_dir
-                    break
-                current_dir = current_dir.parent
-            else:
-                project_root = Path.cwd()
+            project_root = _detect_project_root(Path(__file__).parent)
 
         self.project_root = Path(project_root)
+        self._project_root_str = str(self.project_root)
         self.loaded_files: List[Path] = []
         self.env_vars: Dict[str, str] = {}
+        self._env_vars_view = MappingProxyType(self.env_vars)
 
     def load_env_file(self, file_path: Union[str, Path], override: bool = True) -> bool:
         """
@@ -61,56 +154,44 @@ class EnvLoader:
         Returns:
             True if file was loaded successfully, False otherwise
         """
-        file_path = Path(file_path)
+        # Plain string path operations avoid Path allocations per call
+        file_path = os.fspath(file_path)
 
         # Make path relative to project root if it's not absolute
-        if not file_path.is_absolute():
-            file_path = self.project_root / file_path
+        if not os.path.isabs(file_path):
+            file_path = os.path.join(self._project_root_str, file_path)
 
-        if not file_path.exists():
-            logger.warning(f"Environment file not found: {file_path}")
+        try:
+            # The stat in _parse_env_file doubles as the existence check
+            values = _parse_env_file(file_path)
+        except FileNotFoundError:
+            logger.warning("Environment file not found: %s", file_path)
+            return False
+        except Exception as e:
+            logger.error("Failed to load environment file %s: %s", file_path, e)
             return False
 
         try:
-            loaded_count = 0
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # Parse key=value pairs
-                    if "=" not in line:
-                        logger.warning(
-                            f"Invalid line {line_num} in {file_path}: {line}"
-                        )
-                        continue
-
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-
-                    # Set environment variable
-                    if override or key not in os.environ:
-                        os.environ[key] = value
-                        self.env_vars[key] = value
-                        loaded_count += 1
-
-            self.loaded_files.append(file_path)
+            if override:
+                # Set environment variables in one batch
+                new_vars = values
+                os.environ.update(new_vars)
+            else:
+                # One membership probe per key; no full copy of os.environ
+                environ = os.environ
+                new_vars = {k: v for k, v in values.items() if k not in environ}
+                environ.update(new_vars)
+            self.env_vars.update(new_vars)
+            loaded_count = len(new_vars)
+
+            self.loaded_files.append(Path(file_path))
             logger.info(
-                f"Loaded {loaded_count} environment variables from {file_path}")
+                "Loaded %d environment variables from %s", loaded_count, file_path
+            )
             return True
 
         except Exception as e:
-            logger.error(f"Failed to load environment file {file_path}: {e}")
+            logger.error("Failed to load environment file %s: %s", file_path, e)
             return False
 
     def load_profile_env(self, profile: str = "default") -> bool:
@@ -127,8 +208,15 @@ class EnvLoader:
             profile: Environment profile name (dev, test, prod, etc.)
 
         Returns:
-            True if at least one file was loaded successfully
+            True if at least one file was loaded successfully (or loading
+            was skipped via CLOUDWATCH_AI_SKIP_DOTENV)
         """
+        # Deployments that pass the complete environment externally (e.g. the
+        # MCP server env section) can skip .env file I/O entirely
+        if os.getenv("CLOUDWATCH_AI_SKIP_DOTENV", "0") not in ("", "0"):
+            logger.debug("CLOUDWATCH_AI_SKIP_DOTENV set; skipping .env files")
+            return True
+
         # Load files in reverse order of priority, with override=True for files
         # but preserve external environment variables (those already set)
 
@@ -145,8 +233,18 @@ class EnvLoader:
             # Profile-specific - loaded last, highest priority among files
             files_to_load.append(f".env.{profile}")
 
+        # List the project root once instead of stat'ing each candidate
+        try:
+            with os.scandir(self.project_root) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+
         loaded_any = False
         for env_file in files_to_load:
+            if env_file not in present:
+                logger.debug("Environment file not found: %s", env_file)
+                continue
             # Use override=True to allow later files to override earlier ones
             if self.load_env_file(env_file, override=True):
                 loaded_any = True
@@ -162,10 +260,9 @@ class EnvLoader:
                     del self.env_vars[key]
 
         if loaded_any:
-            logger.info(f"Environment profile '{profile}' loaded successfully")
+            logger.info("Environment profile '%s' loaded successfully", profile)
         else:
-            logger.warning(
-                f"No environment files found for profile '{profile}'")
+            logger.warning("No environment files found for profile '%s'", profile)
 
         return loaded_any
 
@@ -196,14 +293,19 @@ class EnvLoader:
 
         return success
 
-    def get_loaded_variables(self) -> Dict[str, str]:
+    def get_loaded_variables(self, copy: bool = False) -> Mapping[str, str]:
         """
         Get all environment variables loaded by this loader.
 
+        Args:
+            copy: Return a mutable copy instead of a read-only live view
+
         Returns:
-            Dictionary of loaded environment variables
+            Mapping of loaded environment variables
         """
-        return self.env_vars.copy()
+        if copy:
+            return self.env_vars.copy()
+        return self._env_vars_view
 
     def validate_required_vars(self, required_vars: List[str]) -> Dict[str, bool]:
         """
@@ -215,22 +317,20 @@ class EnvLoader:
         Returns:
             Dictionary mapping variable names to whether they are set
         """
-        validation_results = {}
-        missing_vars = []
-
-        for var in required_vars:
-            is_set = bool(os.getenv(var))
-            validation_results[var] = is_set
-            if not is_set:
-                missing_vars.append(var)
-
-        if missing_vars:
-            logger.warning(
-                f"Missing required environment variables: {', '.join(missing_vars)}"
-            )
-        else:
+        environ = os.environ
+        validation_results = {var: bool(environ.get(var)) for var in required_vars}
+
+        if not all(validation_results.values()):
+            if logger.isEnabledFor(logging.WARNING):
+                missing_vars = [var for var, ok in validation_results.items() if not ok]
+                logger.warning(
+                    "Missing required environment variables: %s",
+                    ", ".join(missing_vars),
+                )
+        elif logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"All required environment variables are set: {', '.join(required_vars)}"
+                "All required environment variables are set: %s",
+                ", ".join(required_vars),
             )
 
         return validation_results
@@ -250,40 +350,40 @@ class EnvLoader:
         """
         output_file = Path(output_file)
 
+        # Assemble the whole file first and write it in one call
+        lines = [
+            "# CloudWatch Log Agent Environment Variables\n",
+            "# Generated automatically\n\n",
+        ]
+
+        # Write loaded variables
+        if self.env_vars:
+            lines.append("# Variables loaded from .env files\n")
+            lines.extend(
+                f"{key}={_quote_env_value(value)}\n"
+                for key, value in sorted(self.env_vars.items())
+            )
+            lines.append("\n")
+
+        # Write system variables if requested
+        if include_system_vars:
+            lines.append("# System environment variables\n")
+            lines.extend(
+                f"{key}={_quote_env_value(value)}\n"
+                for key, value in sorted(os.environ.items())
+                # Only include relevant variables
+                if key not in self.env_vars and key.startswith(_EXPORT_PREFIXES)
+            )
+
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write("# CloudWatch Log Agent Environment Variables\n")
-                f.write(f"# Generated automatically\n\n")
-
-                # Write loaded variables
-                if self.env_vars:
-                    f.write("# Variables loaded from .env files\n")
-                    for key, value in sorted(self.env_vars.items()):
-                        # Quote values with spaces
-                        if " " in value:
-                            value = f'"{value}"'
-                        f.write(f"{key}={value}\n")
-                    f.write("\n")
-
-                # Write system variables if requested
-                if include_system_vars:
-                    f.write("# System environment variables\n")
-                    for key, value in sorted(os.environ.items()):
-                        if key not in self.env_vars:
-                            # Only include relevant variables
-                            if any(
-                                prefix in key
-                                for prefix in ["AWS_", "OPENAI_", "ANTHROPIC_", "LOG_"]
-                            ):
-                                if " " in value:
-                                    value = f'"{value}"'
-                                f.write(f"{key}={value}\n")
-
-            logger.info(f"Environment variables exported to {output_file}")
+            with open(output_file, "w", encoding="utf-8", buffering=65536) as f:
+                f.write("".join(lines))
+
+            logger.info("Environment variables exported to %s", output_file)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to export environment variables: {e}")
+            logger.error("Failed to export environment variables: %s", e)
             return False
 
 
@@ -344,29 +444,12 @@ def validate_environment(required_vars: Optional[List[str]] = None) -> Dict[str,
         Dictionary mapping variable names to whether they are set
     """
     if required_vars is None:
-        # Default required variables for CloudWatch Log Agent
-        required_vars = [
-            "AWS_DEFAULT_REGION",  # or AWS_REGION
-            # At least one AI API key
-        ]
-
-        # Check if AWS region is set (either variable)
-        aws_region_set = bool(
-            os.getenv("AWS_DEFAULT_REGION") or os.getenv("AWS_REGION")
-        )
-
-        # Check if at least one AI API key is set
-        ai_keys = [
-            "OPENAI_API_KEY",
-            "ANTHROPIC_API_KEY",
-            "AZURE_OPENAI_API_KEY",
-            "GOOGLE_API_KEY",
-        ]
-        ai_key_set = any(os.getenv(key) for key in ai_keys)
-
-        results = {"AWS_REGION": aws_region_set, "AI_API_KEY": ai_key_set}
-
-        return results
+        # Default checks: an AWS region and at least one AI API key
+        environ = os.environ
+        return {
+            name: any(map(environ.get, candidates))
+            for name, candidates in _DEFAULT_REQUIRED_VARS.items()
+        }
 
     loader = get_env_loader()
     return loader.validate_required_vars(required_vars)
@@ -379,9 +462,11 @@ def _auto_load_environment():
         load_environment()
     except Exception as e:
         logger.debug(
-            f"Auto-load of environment failed (this is normal if no .env files exist): {e}"
+            "Auto-load of environment failed (this is normal if no .env files exist): %s",
+            e,
         )
 
 
-# Auto-load when module is imported
-_auto_load_environment()
+# Auto-load when module is imported (set CLOUDWATCH_AI_AUTOLOAD=0 to skip)
+if os.getenv("CLOUDWATCH_AI_AUTOLOAD", "1") != "0":
+    _auto_load_environment()
@@ -6,9 +6,12 @@ region settings, and investigation parameters using environment variables.
 """
 
 import os
+import sys
 import logging
+import operator
+from collections import ChainMap
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional
 
 # Import environment loader to ensure .env files are loaded
 try:
@@ -26,7 +29,25 @@ except ImportError:
             return {}
 
 
-@dataclass
+# Set once the shared logging configuration has been applied
+_LOGGING_INITIALIZED = False
+
+# AWS variables read by AWSConfig.from_environment, fetched in one call
+_AWS_ENV_KEYS = (
+    "AWS_DEFAULT_REGION",
+    "AWS_REGION",
+    "AWS_PROFILE",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+)
+_AWS_ENV_DEFAULTS = dict.fromkeys(_AWS_ENV_KEYS)
+_get_aws_env = operator.itemgetter(*_AWS_ENV_KEYS)
+
+# Slotted config dataclasses where supported (dataclass slots need 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AWSConfig:
     """AWS configuration settings."""
 
@@ -36,17 +57,20 @@ class AWSConfig:
     secret_access_key: Optional[str] = None
 
     @classmethod
-    def from_environment(cls) -> "AWSConfig":
-        """Create AWS config from environment variables."""
+    def from_environment(cls, env: Mapping[str, str] = os.environ) -> "AWSConfig":
+        """Create AWS config from environment variables (or a snapshot of them)."""
+        default_region, region, profile, access_key_id, secret_access_key = (
+            _get_aws_env(ChainMap(env, _AWS_ENV_DEFAULTS))
+        )
         return cls(
-            region_name=os.getenv("AWS_DEFAULT_REGION", os.getenv("AWS_REGION")),
-            profile_name=os.getenv("AWS_PROFILE"),
-            access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+            region_name=default_region if "AWS_DEFAULT_REGION" in env else region,
+            profile_name=profile,
+            access_key_id=access_key_id,
+            secret_access_key=secret_access_key,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LoggingConfig:
     """Logging configuration for the application."""
 
@@ -54,11 +78,11 @@ class LoggingConfig:
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     @classmethod
-    def from_environment(cls) -> "LoggingConfig":
-        """Create logging config from environment variables."""
+    def from_environment(cls, env: Mapping[str, str] = os.environ) -> "LoggingConfig":
+        """Create logging config from environment variables (or a snapshot of them)."""
         return cls(
-            level=os.getenv("LOG_LEVEL", "INFO").upper(),
-            format=os.getenv(
+            level=env.get("LOG_LEVEL", "INFO").upper(),
+            format=env.get(
                 "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             ),
         )
@@ -71,22 +95,32 @@ class Settings:
         # Ensure environment variables are loaded
         load_environment(env_profile)
 
-        self.aws = AWSConfig.from_environment()
-        self.logging = LoggingConfig.from_environment()
+        # Snapshot the environment once; all config reads use this dict
+        self._env_cache = dict(os.environ)
+
+        self.aws = AWSConfig.from_environment(self._env_cache)
+        self.logging = LoggingConfig.from_environment(self._env_cache)
 
         # Initialize logging
         self._setup_logging()
 
     def _setup_logging(self):
         """Setup logging configuration."""
-        logging.basicConfig(
-            level=getattr(logging, self.logging.level), format=self.logging.format
-        )
+        global _LOGGING_INITIALIZED
+
+        level = getattr(logging, self.logging.level)
+        if _LOGGING_INITIALIZED:
+            # Handlers and library levels are already set; only track the level
+            logging.getLogger().setLevel(level)
+            return
+
+        logging.basicConfig(level=level, format=self.logging.format)
 
         # Reduce boto3/botocore log level to WARNING to avoid spam
         logging.getLogger("boto3").setLevel(logging.WARNING)
         logging.getLogger("botocore").setLevel(logging.WARNING)
         logging.getLogger("urllib3").setLevel(logging.WARNING)
+        _LOGGING_INITIALIZED = True
 
     def validate_aws_config(self) -> bool:
         """
@@ -116,6 +150,12 @@ class Settings:
 
         return True
 
+    def invalidate_env_cache(self):
+        """Re-snapshot the environment and rebuild the configuration objects."""
+        self._env_cache = dict(os.environ)
+        self.aws = AWSConfig.from_environment(self._env_cache)
+        self.logging = LoggingConfig.from_environment(self._env_cache)
+
     def reload(self, env_profile: str = "default"):
         """
         Reload all configuration from environment variables.
@@ -129,8 +169,7 @@ class Settings:
         reload_environment()
 
         # Reload configuration objects
-        self.aws = AWSConfig.from_environment()
-        self.logging = LoggingConfig.from_environment()
+        self.invalidate_env_cache()
         self._setup_logging()
 
     def validate(self) -> dict:
@@ -145,8 +184,8 @@ class Settings:
         # Additional validation
         validation_results["aws_credentials"] = bool(
             self.aws.access_key_id
-            or os.getenv("AWS_PROFILE")
-            or os.getenv("AWS_ROLE_ARN")
+            or self._env_cache.get("AWS_PROFILE")
+            or self._env_cache.get("AWS_ROLE_ARN")
         )
 
         validation_results["aws_region"] = bool(self.aws.region_name)
@@ -154,12 +193,15 @@ class Settings:
         return validation_results
 
 
-# Global settings instance
-settings = Settings()
+# Global settings instance (created on first use)
+settings: Optional[Settings] = None
 
 
 def get_settings() -> Settings:
-    """Get the global settings instance."""
+    """Get the global settings instance, creating it on first use."""
+    global settings
+    if settings is None:
+        settings = Settings()
     return settings
 
 
@@ -186,4 +228,4 @@ def validate_settings() -> dict:
     Returns:
         Dictionary with validation results
     """
-    return settings.validate()
+    return get_settings().validate()
@@ -14,6 +14,13 @@ from .base import AgentError, ErrorContext
 class AgentTeamError(AgentError):
     """Exception class for agent team management errors"""
 
+    __slots__ = ("team_id", "agent_count", "failed_agents")
+
+    _DEFAULT_JA_MSG = "エージェントチームでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "AGENT_TEAM_ERROR"
+
+    _extra_fields = ("team_id", "agent_count", "failed_agents")
+
     def __init__(
         self,
         message: str,
@@ -36,27 +43,16 @@ class AgentTeamError(AgentError):
         self.agent_count = agent_count
         self.failed_agents = failed_agents or []
 
-    def _get_default_japanese_message(self) -> str:
-        return "エージェントチームでエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "AGENT_TEAM_ERROR"
+class AgentModelError(AgentError):
+    """Exception class for agent model integration errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with team-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "team_id": self.team_id,
-                "agent_count": self.agent_count,
-                "failed_agents": self.failed_agents,
-            }
-        )
-        return result
+    __slots__ = ("model_name", "model_provider", "api_error")
 
+    _DEFAULT_JA_MSG = "エージェントモデルでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "AGENT_MODEL_ERROR"
 
-class AgentModelError(AgentError):
-    """Exception class for agent model integration errors"""
+    _extra_fields = ("model_name", "model_provider", "api_error")
 
     def __init__(
         self,
@@ -80,27 +76,16 @@ class AgentModelError(AgentError):
         self.model_provider = model_provider
         self.api_error = api_error
 
-    def _get_default_japanese_message(self) -> str:
-        return "エージェントモデルでエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "AGENT_MODEL_ERROR"
+class AgentOrchestratorError(AgentError):
+    """Exception class for agent orchestrator errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with model-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "model_name": self.model_name,
-                "model_provider": self.model_provider,
-                "api_error": self.api_error,
-            }
-        )
-        return result
+    __slots__ = ("orchestrator_type", "current_step", "workflow_state")
 
+    _DEFAULT_JA_MSG = "エージェントオーケストレーターでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "AGENT_ORCHESTRATOR_ERROR"
 
-class AgentOrchestratorError(AgentError):
-    """Exception class for agent orchestrator errors"""
+    _extra_fields = ("orchestrator_type", "current_step", "workflow_state")
 
     def __init__(
         self,
@@ -124,27 +109,21 @@ class AgentOrchestratorError(AgentError):
         self.current_step = current_step
         self.workflow_state = workflow_state or {}
 
-    def _get_default_japanese_message(self) -> str:
-        return "エージェントオーケストレーターでエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "AGENT_ORCHESTRATOR_ERROR"
+class AgentCommunicationError(AgentError):
+    """Exception class for agent communication errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with orchestrator-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "orchestrator_type": self.orchestrator_type,
-                "current_step": self.current_step,
-                "workflow_state": self.workflow_state,
-            }
-        )
-        return result
+    __slots__ = (
+        "source_agent",
+        "target_agent",
+        "communication_type",
+        "message_content",
+    )
 
+    _DEFAULT_JA_MSG = "エージェント間通信でエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "AGENT_COMMUNICATION_ERROR"
 
-class AgentCommunicationError(AgentError):
-    """Exception class for agent communication errors"""
+    _extra_fields = ("source_agent", "target_agent", "communication_type", "message_content")
 
     def __init__(
         self,
@@ -170,22 +149,3 @@ class AgentCommunicationError(AgentError):
         self.target_agent = target_agent
         self.communication_type = communication_type
         self.message_content = message_content
-
-    def _get_default_japanese_message(self) -> str:
-        return "エージェント間通信でエラーが発生しました"
-
-    def _get_default_error_code(self) -> str:
-        return "AGENT_COMMUNICATION_ERROR"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with communication-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "source_agent": self.source_agent,
-                "target_agent": self.target_agent,
-                "communication_type": self.communication_type,
-                "message_content": self.message_content,
-            }
-        )
-        return result
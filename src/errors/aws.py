@@ -7,13 +7,20 @@ Author: CloudWatch Logs AI Agent Team
 License: MIT
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional
 from .base import AgentError, ErrorContext
 
 
 class AWSError(AgentError):
     """Base exception class for AWS-related errors"""
 
+    __slots__ = ("aws_error_code", "aws_error_message", "aws_request_id", "region")
+
+    _DEFAULT_JA_MSG = "AWSサービスでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "AWS_ERROR"
+
+    _extra_fields = ("aws_error_code", "aws_error_message", "aws_request_id", "region")
+
     def __init__(
         self,
         message: str,
@@ -39,39 +46,26 @@ class AWSError(AgentError):
         self.aws_request_id = request_id
         self.region = region
 
-    def _get_default_japanese_message(self) -> str:
-        return "AWSサービスでエラーが発生しました"
-
-    def _get_default_error_code(self) -> str:
-        return "AWS_ERROR"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with AWS-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "aws_error_code": self.aws_error_code,
-                "aws_error_message": self.aws_error_message,
-                "aws_request_id": self.aws_request_id,
-                "region": self.region,
-            }
-        )
-        return result
-
 
 class CloudWatchError(AWSError):
     """Exception class for CloudWatch service errors"""
 
-    def _get_default_japanese_message(self) -> str:
-        return "CloudWatchサービスでエラーが発生しました"
+    __slots__ = ()
 
-    def _get_default_error_code(self) -> str:
-        return "CLOUDWATCH_ERROR"
+    _DEFAULT_JA_MSG = "CloudWatchサービスでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "CLOUDWATCH_ERROR"
 
 
 class CloudWatchLogsError(CloudWatchError):
     """Exception class for CloudWatch Logs service errors"""
 
+    __slots__ = ("log_group_name", "log_stream_name")
+
+    _DEFAULT_JA_MSG = "CloudWatch Logsでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "CLOUDWATCH_LOGS_ERROR"
+
+    _extra_fields = ("log_group_name", "log_stream_name")
+
     def __init__(
         self,
         message: str,
@@ -91,26 +85,16 @@ class CloudWatchLogsError(CloudWatchError):
         self.log_group_name = log_group_name
         self.log_stream_name = log_stream_name
 
-    def _get_default_japanese_message(self) -> str:
-        return "CloudWatch Logsでエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "CLOUDWATCH_LOGS_ERROR"
+class CredentialsError(AWSError):
+    """Exception class for AWS credentials-related errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with CloudWatch Logs specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "log_group_name": self.log_group_name,
-                "log_stream_name": self.log_stream_name,
-            }
-        )
-        return result
+    __slots__ = ("credential_type",)
 
+    _DEFAULT_JA_MSG = "AWS認証情報でエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "CREDENTIALS_ERROR"
 
-class CredentialsError(AWSError):
-    """Exception class for AWS credentials-related errors"""
+    _extra_fields = ("credential_type",)
 
     def __init__(self, message: str, credential_type: Optional[str] = None, **kwargs):
         """Initialize credentials error
@@ -123,21 +107,16 @@ class CredentialsError(AWSError):
         super().__init__(message, **kwargs)
         self.credential_type = credential_type
 
-    def _get_default_japanese_message(self) -> str:
-        return "AWS認証情報でエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "CREDENTIALS_ERROR"
+class RegionError(AWSError):
+    """Exception class for AWS region-related errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with credentials-specific fields"""
-        result = super().to_dict()
-        result["credential_type"] = self.credential_type
-        return result
+    __slots__ = ("invalid_region", "valid_regions")
 
+    _DEFAULT_JA_MSG = "AWSリージョンが無効です"
+    _DEFAULT_ERROR_CODE = "REGION_ERROR"
 
-class RegionError(AWSError):
-    """Exception class for AWS region-related errors"""
+    _extra_fields = ("invalid_region", "valid_regions")
 
     def __init__(
         self,
@@ -158,23 +137,20 @@ class RegionError(AWSError):
         self.invalid_region = invalid_region
         self.valid_regions = valid_regions or []
 
-    def _get_default_japanese_message(self) -> str:
-        return "AWSリージョンが無効です"
 
-    def _get_default_error_code(self) -> str:
-        return "REGION_ERROR"
+class ResourceNotFoundError(AWSError):
+    """Exception class for AWS resource not found errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with region-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {"invalid_region": self.invalid_region, "valid_regions": self.valid_regions}
-        )
-        return result
+    __slots__ = ("resource_type", "resource_identifier")
 
+    _DEFAULT_JA_MSG = "指定されたAWSリソースが見つかりません"
+    _DEFAULT_ERROR_CODE = "RESOURCE_NOT_FOUND"
+    _JA_MSG_BY_RESOURCE = {
+        "LOG_GROUP": "指定されたログ グループが見つかりません",
+        "LOG_STREAM": "指定されたログ ストリームが見つかりません",
+    }
 
-class ResourceNotFoundError(AWSError):
-    """Exception class for AWS resource not found errors"""
+    _extra_fields = ("resource_type", "resource_identifier")
 
     def __init__(
         self,
@@ -196,23 +172,4 @@ class ResourceNotFoundError(AWSError):
         self.resource_identifier = resource_identifier
 
     def _get_default_japanese_message(self) -> str:
-        if self.resource_type == "LOG_GROUP":
-            return "指定されたログ グループが見つかりません"
-        elif self.resource_type == "LOG_STREAM":
-            return "指定されたログ ストリームが見つかりません"
-        else:
-            return "指定されたAWSリソースが見つかりません"
-
-    def _get_default_error_code(self) -> str:
-        return "RESOURCE_NOT_FOUND"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with resource-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "resource_type": self.resource_type,
-                "resource_identifier": self.resource_identifier,
-            }
-        )
-        return result
+        return self._JA_MSG_BY_RESOURCE.get(self.resource_type, self._DEFAULT_JA_MSG)
@@ -7,24 +7,212 @@ Author: CloudWatch Logs AI Agent Team
 License: MIT
 """
 
+import functools
+import os
+import sys
+import time
 import traceback
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
 
 
-@dataclass
 class ErrorContext:
-    """Error context information for debugging and monitoring"""
+    """Error context information for debugging and monitoring
 
-    timestamp: datetime = field(default_factory=lambda: datetime.utcnow())
-    component: Optional[str] = None
-    operation: Optional[str] = None
-    request_id: Optional[str] = None
-    user_id: Optional[str] = None
-    session_id: Optional[str] = None
-    additional_data: Dict[str, Any] = field(default_factory=dict)
-    stack_trace: Optional[str] = None
+    Every AgentError carries one of these, so the class is slotted and the
+    timestamp and additional_data defaults are only created when first read.
+    The creation time is kept as an epoch float until timestamp is needed.
+    """
+
+    __slots__ = (
+        "_created",
+        "_timestamp",
+        "component",
+        "operation",
+        "request_id",
+        "user_id",
+        "session_id",
+        "_additional_data",
+        "stack_trace",
+    )
+
+    # Public field names, in constructor order
+    _FIELDS = (
+        "timestamp",
+        "component",
+        "operation",
+        "request_id",
+        "user_id",
+        "session_id",
+        "additional_data",
+        "stack_trace",
+    )
+
+    def __init__(
+        self,
+        timestamp: Optional[datetime] = None,
+        component: Optional[str] = None,
+        operation: Optional[str] = None,
+        request_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        additional_data: Optional[Dict[str, Any]] = None,
+        stack_trace: Optional[str] = None,
+    ):
+        self._created = time.time() if timestamp is None else None
+        self._timestamp = timestamp
+        self.component = component
+        self.operation = operation
+        self.request_id = request_id
+        self.user_id = user_id
+        self.session_id = session_id
+        self._additional_data = additional_data
+        self.stack_trace = stack_trace
+
+    @property
+    def timestamp(self) -> datetime:
+        """UTC creation time, converted to a datetime on first access"""
+        if self._timestamp is None:
+            self._timestamp = datetime.utcfromtimestamp(self._created)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+
+    @property
+    def additional_data(self) -> Dict[str, Any]:
+        """Free-form context data, created empty on first access"""
+        if self._additional_data is None:
+            self._additional_data = {}
+        return self._additional_data
+
+    @additional_data.setter
+    def additional_data(self, value: Dict[str, Any]) -> None:
+        self._additional_data = value
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"{self.__class__.__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self._FIELDS
+        )
+
+
+# Stack traces of the exception being handled are captured for every
+# AgentError unless CLOUDWATCH_AI_CAPTURE_STACKS=0
+_CAPTURE_STACKS = os.getenv("CLOUDWATCH_AI_CAPTURE_STACKS", "1") != "0"
+
+
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Every ``__slots__`` entry declared along the MRO of ``cls``"""
+    return tuple(
+        name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _serialized_fields(cls: type) -> Tuple[str, ...]:
+    """Every ``_extra_fields`` entry declared along the MRO of ``cls``, bases first"""
+    return tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name in klass.__dict__.get("_extra_fields", ())
+    )
+
+
+# Fields every error serializes, as (key, expression) pairs in output order
+_BASE_TO_DICT_ITEMS = (
+    ("error_type", "self.__class__.__name__"),
+    ("error_code", "self.error_code"),
+    ("message", "self.message"),
+    ("japanese_message", "self.japanese_message"),
+    ("recoverable", "self.recoverable"),
+    ("timestamp", "context.timestamp.isoformat()"),
+    ("component", "context.component"),
+    ("operation", "context.operation"),
+    ("request_id", "context.request_id"),
+    ("user_id", "context.user_id"),
+    ("session_id", "context.session_id"),
+    ("additional_data", "context.additional_data"),
+    ("stack_trace", "self.stack_trace"),
+    ("cause", "str(self.cause) if self.cause else None"),
+)
+
+_TO_DICT_TAIL = """\
+    if extra:
+        result.update(extra)
+    if include_none:
+        return result
+    return {key: value for key, value in result.items() if value is not None}
+"""
+
+
+def _build_to_dict(cls: type, parent: Optional[type] = None):
+    """Compile a straight-line to_dict for ``cls``
+
+    Without ``parent`` the function builds the whole dictionary itself from
+    the base items and every ``_extra_fields`` entry along the MRO. With a
+    hand-written to_dict on ``parent``, it passes only the fields declared
+    below ``parent`` through to it.
+    """
+    if parent is None:
+        items = _BASE_TO_DICT_ITEMS + tuple(
+            (name, f"self.{name}") for name in _serialized_fields(cls)
+        )
+        body = "".join(f"        {key!r}: {expr},\n" for key, expr in items)
+        source = (
+            "def to_dict(self, extra=None, include_none=False):\n"
+            "    context = self.context\n"
+            f"    result = {{\n{body}    }}\n" + _TO_DICT_TAIL
+        )
+    else:
+        inherited = set(_serialized_fields(parent))
+        items = "".join(
+            f"{name!r}: self.{name}, "
+            for name in _serialized_fields(cls)
+            if name not in inherited
+        )
+        source = (
+            "def to_dict(self, extra=None, include_none=False):\n"
+            "    return super(cls, self).to_dict(\n"
+            f"        {{{items}**(extra or {{}})}}, include_none\n"
+            "    )\n"
+        )
+    namespace = {"cls": cls}
+    exec(source, namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = """Convert error to dictionary for serialization
+
+        Args:
+            extra: Fields appended after the class's own fields
+            include_none: Keep fields whose value is None (omitted by default)
+        """
+    to_dict._generated = True
+    return to_dict
+
+
+@functools.lru_cache(maxsize=1024)
+def _detail_fields(
+    error_code: Optional[str], component: Optional[str], operation: Optional[str]
+) -> str:
+    """Detailed-message fragment for the identifiers that repeat across errors"""
+    return " | ".join(
+        filter(
+            None,
+            (
+                error_code and f"Code: {error_code}",
+                component and f"Component: {component}",
+                operation and f"Operation: {operation}",
+            ),
+        )
+    )
 
 
 class AgentError(Exception):
@@ -36,8 +224,41 @@ class AgentError(Exception):
     - Error context information
     - Error categorization
     - Debug information
+
+    Subclasses that only add plain attributes to the serialized form list
+    them in ``_extra_fields``. Each class gets a to_dict compiled for its
+    full field set, so serializing never walks the class hierarchy.
     """
 
+    __slots__ = (
+        "message",
+        "_japanese_message",
+        "_error_code",
+        "context",
+        "cause",
+        "recoverable",
+        "_exc_info",
+    )
+
+    # Defaults used when no japanese_message / error_code is given
+    _DEFAULT_JA_MSG = "予期しないエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "AGENT_ERROR"
+
+    # Attribute names a class adds to to_dict, on top of its bases' fields
+    _extra_fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "to_dict" in cls.__dict__:
+            return
+        owner = next(klass for klass in cls.__mro__ if "to_dict" in klass.__dict__)
+        if _serialized_fields(cls) == _serialized_fields(owner):
+            return
+        if getattr(owner.__dict__["to_dict"], "_generated", False):
+            cls.to_dict = _build_to_dict(cls)
+        else:
+            cls.to_dict = _build_to_dict(cls, owner)
+
     def __init__(
         self,
         message: str,
@@ -59,42 +280,75 @@ class AgentError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.japanese_message = japanese_message or self._get_default_japanese_message()
-        self.error_code = error_code or self._get_default_error_code()
+        # Defaults are resolved on first access by the properties below
+        self._japanese_message = japanese_message or None
+        self._error_code = error_code or None
         self.context = context or ErrorContext()
         self.cause = cause
         self.recoverable = recoverable
 
-        # Capture stack trace if not already provided
-        if not self.context.stack_trace:
-            self.context.stack_trace = traceback.format_exc()
+        # Keep the exception being handled, if any; its stack trace is only
+        # formatted when stack_trace is first read
+        self._exc_info = None
+        if _CAPTURE_STACKS and not self.context.stack_trace:
+            exc_info = sys.exc_info()
+            if exc_info[0] is not None:
+                self._exc_info = exc_info
+
+    @property
+    def japanese_message(self) -> str:
+        """Japanese message for user display, defaulting per error type"""
+        if self._japanese_message is None:
+            self._japanese_message = self._get_default_japanese_message()
+        return self._japanese_message
+
+    @japanese_message.setter
+    def japanese_message(self, value: Optional[str]) -> None:
+        self._japanese_message = value or None
+
+    @property
+    def error_code(self) -> str:
+        """Error code for categorization, defaulting per error type"""
+        if self._error_code is None:
+            self._error_code = self._get_default_error_code()
+        return self._error_code
+
+    @error_code.setter
+    def error_code(self, value: Optional[str]) -> None:
+        self._error_code = value or None
+
+    @property
+    def stack_trace(self) -> Optional[str]:
+        """Stack trace of the exception being handled when this error was created
+
+        None when the error was raised outside of an except block.
+        """
+        if self._exc_info is not None:
+            self.context.stack_trace = "".join(
+                traceback.format_exception(*self._exc_info)
+            )
+            self._exc_info = None
+        return self.context.stack_trace
+
+    def __reduce__(self):
+        # BaseException only pickles __dict__, so slotted attributes are passed
+        # as state; the pending traceback is formatted since it can't be pickled
+        self.stack_trace
+        state = {
+            name: getattr(self, name)
+            for name in _slot_names(type(self))
+            if hasattr(self, name)
+        }
+        state.update(self.__dict__)
+        return type(self), self.args, state
 
     def _get_default_japanese_message(self) -> str:
         """Get default Japanese message for this error type"""
-        return "予期しないエラーが発生しました"
+        return self._DEFAULT_JA_MSG
 
     def _get_default_error_code(self) -> str:
         """Get default error code for this error type"""
-        return "AGENT_ERROR"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for serialization"""
-        return {
-            "error_type": self.__class__.__name__,
-            "error_code": self.error_code,
-            "message": self.message,
-            "japanese_message": self.japanese_message,
-            "recoverable": self.recoverable,
-            "timestamp": self.context.timestamp.isoformat(),
-            "component": self.context.component,
-            "operation": self.context.operation,
-            "request_id": self.context.request_id,
-            "user_id": self.context.user_id,
-            "session_id": self.context.session_id,
-            "additional_data": self.context.additional_data,
-            "stack_trace": self.context.stack_trace,
-            "cause": str(self.cause) if self.cause else None,
-        }
+        return self._DEFAULT_ERROR_CODE
 
     def get_user_message(self) -> str:
         """Get user-friendly message for display"""
@@ -102,33 +356,40 @@ class AgentError(Exception):
 
     def get_detailed_message(self) -> str:
         """Get detailed message including context for logging"""
-        details = [f"Error: {self.message}"]
-        if self.error_code:
-            details.append(f"Code: {self.error_code}")
-        if self.context.component:
-            details.append(f"Component: {self.context.component}")
-        if self.context.operation:
-            details.append(f"Operation: {self.context.operation}")
-        if self.context.request_id:
-            details.append(f"Request ID: {self.context.request_id}")
-        if self.cause:
-            details.append(f"Caused by: {self.cause}")
-        return " | ".join(details)
+        context = self.context
+        return " | ".join(
+            filter(
+                None,
+                (
+                    f"Error: {self.message}",
+                    _detail_fields(self.error_code, context.component, context.operation),
+                    context.request_id and f"Request ID: {context.request_id}",
+                    self.cause and f"Caused by: {self.cause}",
+                ),
+            )
+        )
+
+
+AgentError.to_dict = _build_to_dict(AgentError)
 
 
 class AgentConfigurationError(AgentError):
     """Exception raised for configuration-related errors"""
 
-    def _get_default_japanese_message(self) -> str:
-        return "設定エラーが発生しました"
+    __slots__ = ()
 
-    def _get_default_error_code(self) -> str:
-        return "CONFIGURATION_ERROR"
+    _DEFAULT_JA_MSG = "設定エラーが発生しました"
+    _DEFAULT_ERROR_CODE = "CONFIGURATION_ERROR"
 
 
 class AgentValidationError(AgentError):
     """Exception raised for validation errors"""
 
+    __slots__ = ("field", "value", "validation_errors")
+
+    _DEFAULT_JA_MSG = "入力パラメータの検証エラーが発生しました"
+    _DEFAULT_ERROR_CODE = "VALIDATION_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -151,28 +412,31 @@ class AgentValidationError(AgentError):
         self.value = value
         self.validation_errors = validation_errors or []
 
-    def _get_default_japanese_message(self) -> str:
-        return "入力パラメータの検証エラーが発生しました"
-
-    def _get_default_error_code(self) -> str:
-        return "VALIDATION_ERROR"
-
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(
+        self, extra: Optional[Dict[str, Any]] = None, include_none: bool = False
+    ) -> Dict[str, Any]:
         """Convert error to dictionary with validation-specific fields"""
-        result = super().to_dict()
-        result.update(
+        return super().to_dict(
             {
                 "field": self.field,
                 "value": str(self.value) if self.value is not None else None,
                 "validation_errors": self.validation_errors,
-            }
+                **(extra or {}),
+            },
+            include_none=include_none,
         )
-        return result
 
 
 class AgentTimeoutError(AgentError):
     """Exception raised for timeout-related errors"""
 
+    __slots__ = ("timeout_seconds",)
+
+    _DEFAULT_JA_MSG = "処理がタイムアウトしました"
+    _DEFAULT_ERROR_CODE = "TIMEOUT_ERROR"
+
+    _extra_fields = ("timeout_seconds",)
+
     def __init__(self, message: str, timeout_seconds: Optional[float] = None, **kwargs):
         """Initialize timeout error
 
@@ -184,21 +448,16 @@ class AgentTimeoutError(AgentError):
         super().__init__(message, **kwargs)
         self.timeout_seconds = timeout_seconds
 
-    def _get_default_japanese_message(self) -> str:
-        return "処理がタイムアウトしました"
 
-    def _get_default_error_code(self) -> str:
-        return "TIMEOUT_ERROR"
+class AgentResourceError(AgentError):
+    """Exception raised for resource-related errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with timeout-specific fields"""
-        result = super().to_dict()
-        result["timeout_seconds"] = self.timeout_seconds
-        return result
+    __slots__ = ("resource_type", "resource_id")
 
+    _DEFAULT_JA_MSG = "リソースエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "RESOURCE_ERROR"
 
-class AgentResourceError(AgentError):
-    """Exception raised for resource-related errors"""
+    _extra_fields = ("resource_type", "resource_id")
 
     def __init__(
         self,
@@ -218,17 +477,3 @@ class AgentResourceError(AgentError):
         super().__init__(message, **kwargs)
         self.resource_type = resource_type
         self.resource_id = resource_id
-
-    def _get_default_japanese_message(self) -> str:
-        return "リソースエラーが発生しました"
-
-    def _get_default_error_code(self) -> str:
-        return "RESOURCE_ERROR"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with resource-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {"resource_type": self.resource_type, "resource_id": self.resource_id}
-        )
-        return result
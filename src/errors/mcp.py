@@ -7,13 +7,20 @@ Author: CloudWatch Logs AI Agent Team
 License: MIT
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional
 from .base import AgentError, ErrorContext
 
 
 class MCPError(AgentError):
     """Base exception class for MCP-related errors"""
 
+    __slots__ = ("mcp_method", "mcp_request_id")
+
+    _DEFAULT_JA_MSG = "MCPプロトコルでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "MCP_ERROR"
+
+    _extra_fields = ("mcp_method", "mcp_request_id")
+
     def __init__(
         self,
         message: str,
@@ -33,23 +40,16 @@ class MCPError(AgentError):
         self.mcp_method = mcp_method
         self.mcp_request_id = mcp_request_id
 
-    def _get_default_japanese_message(self) -> str:
-        return "MCPプロトコルでエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "MCP_ERROR"
+class MCPServerError(MCPError):
+    """Exception class for MCP server errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with MCP-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {"mcp_method": self.mcp_method, "mcp_request_id": self.mcp_request_id}
-        )
-        return result
+    __slots__ = ("server_component", "port")
 
+    _DEFAULT_JA_MSG = "MCPサーバーでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "MCP_SERVER_ERROR"
 
-class MCPServerError(MCPError):
-    """Exception class for MCP server errors"""
+    _extra_fields = ("server_component", "port")
 
     def __init__(
         self,
@@ -70,21 +70,16 @@ class MCPServerError(MCPError):
         self.server_component = server_component
         self.port = port
 
-    def _get_default_japanese_message(self) -> str:
-        return "MCPサーバーでエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "MCP_SERVER_ERROR"
+class MCPClientError(MCPError):
+    """Exception class for MCP client errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with server-specific fields"""
-        result = super().to_dict()
-        result.update({"server_component": self.server_component, "port": self.port})
-        return result
+    __slots__ = ("client_type", "server_url")
 
+    _DEFAULT_JA_MSG = "MCPクライアントでエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "MCP_CLIENT_ERROR"
 
-class MCPClientError(MCPError):
-    """Exception class for MCP client errors"""
+    _extra_fields = ("client_type", "server_url")
 
     def __init__(
         self,
@@ -105,21 +100,16 @@ class MCPClientError(MCPError):
         self.client_type = client_type
         self.server_url = server_url
 
-    def _get_default_japanese_message(self) -> str:
-        return "MCPクライアントでエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "MCP_CLIENT_ERROR"
+class MCPConnectionError(MCPError):
+    """Exception class for MCP connection errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with client-specific fields"""
-        result = super().to_dict()
-        result.update({"client_type": self.client_type, "server_url": self.server_url})
-        return result
+    __slots__ = ("connection_type", "endpoint", "retry_count")
 
+    _DEFAULT_JA_MSG = "MCP接続でエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "MCP_CONNECTION_ERROR"
 
-class MCPConnectionError(MCPError):
-    """Exception class for MCP connection errors"""
+    _extra_fields = ("connection_type", "endpoint", "retry_count")
 
     def __init__(
         self,
@@ -143,27 +133,16 @@ class MCPConnectionError(MCPError):
         self.endpoint = endpoint
         self.retry_count = retry_count
 
-    def _get_default_japanese_message(self) -> str:
-        return "MCP接続でエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "MCP_CONNECTION_ERROR"
+class MCPProtocolError(MCPError):
+    """Exception class for MCP protocol violations and invalid requests"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with connection-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "connection_type": self.connection_type,
-                "endpoint": self.endpoint,
-                "retry_count": self.retry_count,
-            }
-        )
-        return result
+    __slots__ = ("protocol_version", "invalid_field")
 
+    _DEFAULT_JA_MSG = "MCPプロトコルエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "MCP_PROTOCOL_ERROR"
 
-class MCPProtocolError(MCPError):
-    """Exception class for MCP protocol violations and invalid requests"""
+    _extra_fields = ("protocol_version", "invalid_field")
 
     def __init__(
         self,
@@ -183,20 +162,3 @@ class MCPProtocolError(MCPError):
         super().__init__(message, **kwargs)
         self.protocol_version = protocol_version
         self.invalid_field = invalid_field
-
-    def _get_default_japanese_message(self) -> str:
-        return "MCPプロトコルエラーが発生しました"
-
-    def _get_default_error_code(self) -> str:
-        return "MCP_PROTOCOL_ERROR"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with protocol-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "protocol_version": self.protocol_version,
-                "invalid_field": self.invalid_field,
-            }
-        )
-        return result
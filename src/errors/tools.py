@@ -14,6 +14,13 @@ from .base import AgentError, ErrorContext
 class ToolError(AgentError):
     """Base exception class for tool-related errors"""
 
+    __slots__ = ("tool_name", "tool_version")
+
+    _DEFAULT_JA_MSG = "ツール実行中にエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "TOOL_ERROR"
+
+    _extra_fields = ("tool_name", "tool_version")
+
     def __init__(
         self,
         message: str,
@@ -33,21 +40,21 @@ class ToolError(AgentError):
         self.tool_name = tool_name
         self.tool_version = tool_version
 
-    def _get_default_japanese_message(self) -> str:
-        return "ツール実行中にエラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "TOOL_ERROR"
+class ToolExecutionError(ToolError):
+    """Exception class for tool execution errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with tool-specific fields"""
-        result = super().to_dict()
-        result.update({"tool_name": self.tool_name, "tool_version": self.tool_version})
-        return result
+    __slots__ = ("execution_stage", "parameters", "output")
 
+    _DEFAULT_JA_MSG = "ツールの実行中にエラーが発生しました"
+    _DEFAULT_ERROR_CODE = "TOOL_EXECUTION_ERROR"
+    _JA_MSG_BY_TOOL = {
+        "investigate": "調査ツールの実行中にエラーが発生しました",
+        "list_log_groups": "ログ グループ一覧の取得中にエラーが発生しました",
+        "analyze_patterns": "パターン分析中にエラーが発生しました",
+    }
 
-class ToolExecutionError(ToolError):
-    """Exception class for tool execution errors"""
+    _extra_fields = ("execution_stage", "parameters", "output")
 
     def __init__(
         self,
@@ -72,34 +79,19 @@ class ToolExecutionError(ToolError):
         self.output = output
 
     def _get_default_japanese_message(self) -> str:
-        if self.tool_name == "investigate":
-            return "調査ツールの実行中にエラーが発生しました"
-        elif self.tool_name == "list_log_groups":
-            return "ログ グループ一覧の取得中にエラーが発生しました"
-        elif self.tool_name == "analyze_patterns":
-            return "パターン分析中にエラーが発生しました"
-        else:
-            return "ツールの実行中にエラーが発生しました"
-
-    def _get_default_error_code(self) -> str:
-        return "TOOL_EXECUTION_ERROR"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with execution-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "execution_stage": self.execution_stage,
-                "parameters": self.parameters,
-                "output": self.output,
-            }
-        )
-        return result
+        return self._JA_MSG_BY_TOOL.get(self.tool_name, self._DEFAULT_JA_MSG)
 
 
 class ToolValidationError(ToolError):
     """Exception class for tool parameter validation errors"""
 
+    __slots__ = ("invalid_parameters", "validation_details")
+
+    _DEFAULT_JA_MSG = "ツールパラメータの検証エラーが発生しました"
+    _DEFAULT_ERROR_CODE = "TOOL_VALIDATION_ERROR"
+
+    _extra_fields = ("invalid_parameters", "validation_details")
+
     def __init__(
         self,
         message: str,
@@ -119,26 +111,16 @@ class ToolValidationError(ToolError):
         self.invalid_parameters = invalid_parameters or []
         self.validation_details = validation_details or {}
 
-    def _get_default_japanese_message(self) -> str:
-        return "ツールパラメータの検証エラーが発生しました"
 
-    def _get_default_error_code(self) -> str:
-        return "TOOL_VALIDATION_ERROR"
+class ToolTimeoutError(ToolError):
+    """Exception class for tool timeout errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with validation-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "invalid_parameters": self.invalid_parameters,
-                "validation_details": self.validation_details,
-            }
-        )
-        return result
+    __slots__ = ("timeout_seconds", "elapsed_seconds")
 
+    _DEFAULT_JA_MSG = "ツール実行がタイムアウトしました"
+    _DEFAULT_ERROR_CODE = "TOOL_TIMEOUT_ERROR"
 
-class ToolTimeoutError(ToolError):
-    """Exception class for tool timeout errors"""
+    _extra_fields = ("timeout_seconds", "elapsed_seconds")
 
     def __init__(
         self,
@@ -159,26 +141,21 @@ class ToolTimeoutError(ToolError):
         self.timeout_seconds = timeout_seconds
         self.elapsed_seconds = elapsed_seconds
 
-    def _get_default_japanese_message(self) -> str:
-        return "ツール実行がタイムアウトしました"
 
-    def _get_default_error_code(self) -> str:
-        return "TOOL_TIMEOUT_ERROR"
+class ToolDependencyError(ToolError):
+    """Exception class for tool dependency errors"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with timeout-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "timeout_seconds": self.timeout_seconds,
-                "elapsed_seconds": self.elapsed_seconds,
-            }
-        )
-        return result
+    __slots__ = ("missing_dependencies", "dependency_type")
 
+    _DEFAULT_JA_MSG = "ツールの依存関係エラーが発生しました"
+    _DEFAULT_ERROR_CODE = "TOOL_DEPENDENCY_ERROR"
+    _JA_MSG_BY_DEPENDENCY = {
+        "aws_service": "必要なAWSサービスへのアクセスができません",
+        "python_package": "必要なPythonパッケージが見つかりません",
+        "system_tool": "必要なシステムツールが見つかりません",
+    }
 
-class ToolDependencyError(ToolError):
-    """Exception class for tool dependency errors"""
+    _extra_fields = ("missing_dependencies", "dependency_type")
 
     def __init__(
         self,
@@ -200,25 +177,4 @@ class ToolDependencyError(ToolError):
         self.dependency_type = dependency_type
 
     def _get_default_japanese_message(self) -> str:
-        if self.dependency_type == "aws_service":
-            return "必要なAWSサービスへのアクセスができません"
-        elif self.dependency_type == "python_package":
-            return "必要なPythonパッケージが見つかりません"
-        elif self.dependency_type == "system_tool":
-            return "必要なシステムツールが見つかりません"
-        else:
-            return "ツールの依存関係エラーが発生しました"
-
-    def _get_default_error_code(self) -> str:
-        return "TOOL_DEPENDENCY_ERROR"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary with dependency-specific fields"""
-        result = super().to_dict()
-        result.update(
-            {
-                "missing_dependencies": self.missing_dependencies,
-                "dependency_type": self.dependency_type,
-            }
-        )
-        return result
+        return self._JA_MSG_BY_DEPENDENCY.get(self.dependency_type, self._DEFAULT_JA_MSG)
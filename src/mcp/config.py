@@ -3,9 +3,12 @@
 Direct CloudWatch integration configuration without AI Agent complexity.
 """
 
+import atexit
 import logging
 import os
 import json
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
 from enum import Enum
@@ -44,6 +47,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Background thread writing the records queued by MCPConfig.setup_logging()
+_log_listener: Optional[QueueListener] = None
+
+
+@atexit.register
+def _stop_log_listener() -> None:
+    """Flush queued log records and stop the listener thread"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 
 class LogLevel(str, Enum):
     """Supported logging levels"""
@@ -263,10 +278,23 @@ class MCPConfig(BaseSettings):
         return issues
 
     def setup_logging(self) -> None:
-        """Setup logging based on configuration"""
+        """Setup logging based on configuration
+
+        Records are only queued on the logging thread; a background listener
+        formats them with ``log_format`` and writes them to stderr.
+        """
+        global _log_listener
+
+        _stop_log_listener()
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(self.log_format))
+        log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, handler)
+        _log_listener.start()
+
         logging.basicConfig(
             level=getattr(logging, self.log_level.value),
-            format=self.log_format,
+            handlers=[QueueHandler(log_queue)],
             force=True,
         )
 
@@ -29,13 +29,76 @@ Example:
     5
 """
 
+import asyncio
+import functools
 import json
 import logging
+import time
 from datetime import datetime, timezone, timedelta
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+def _dumps_result(obj) -> str:
+    """Serialize a tool result as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+class AdaptiveBatcher:
+    """
+    Adaptive batch size for concurrent CloudWatch searches.
+
+    Uses AIMD on an exponentially weighted moving average of per-call
+    latency (batch wall time divided by batch size): the batch size grows
+    by one while that stays under the target and halves when it goes over,
+    e.g. when CloudWatch starts throttling and calls stop overlapping.
+    """
+
+    def __init__(
+        self,
+        min_batch_size: int = 4,
+        max_batch_size: int = 32,
+        target_latency: float = 0.5,
+        smoothing: float = 0.3,
+    ):
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        # Seconds per search, amortized over the concurrently issued batch
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+        self.batch_size = min_batch_size
+        self.avg_latency: Optional[float] = None
+
+    def optimal_size(self) -> int:
+        """Get the batch size to use for the next batch."""
+        return self.batch_size
+
+    def record(self, batch_size: int, latency: float) -> None:
+        """Record the wall time (seconds) of a completed batch."""
+        per_call = latency / max(1, batch_size)
+        if self.avg_latency is None:
+            self.avg_latency = per_call
+        else:
+            self.avg_latency += self.smoothing * (per_call - self.avg_latency)
+
+        if self.avg_latency > self.target_latency:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif batch_size >= self.batch_size:
+            # Only grow when the current size was actually exercised
+            self.batch_size = min(self.max_batch_size, self.batch_size + 1)
+
+
 # Import new CloudWatch logs module
 try:
     from .cloudwatch_logs_tools import (
@@ -101,7 +164,7 @@ def list_log_groups(name_prefix: str = "", limit: int = 50) -> str:
                 "total_found": len(simplified_groups),
                 "log_groups": simplified_groups,
             }
-            return json.dumps(mcp_result, ensure_ascii=False, indent=2)
+            return _dumps_result(mcp_result)
         else:
             return json.dumps(
                 {"error": "Failed to retrieve log groups"}, ensure_ascii=False
@@ -168,7 +231,7 @@ def list_log_streams(
                 "total_found": len(simplified_streams),
                 "streams": simplified_streams,
             }
-            return json.dumps(mcp_result, ensure_ascii=False, indent=2)
+            return _dumps_result(mcp_result)
         else:
             return json.dumps(
                 {"error": f"Failed to retrieve streams for {log_group_name}"},
@@ -239,7 +302,7 @@ def search_log_events(
                 "total_found": len(simplified_events),
                 "events": simplified_events,
             }
-            return json.dumps(mcp_result, ensure_ascii=False, indent=2)
+            return _dumps_result(mcp_result)
         else:
             return json.dumps(
                 {"error": f"Failed to search logs in {log_group_name}"},
@@ -252,6 +315,60 @@ def search_log_events(
         return json.dumps({"error": error_msg}, ensure_ascii=False)
 
 
+async def search_log_events_batch(
+    log_group_names: List[str],
+    filter_pattern: str = "",
+    hours_back: int = 24,
+    max_events: int = 100,
+) -> str:
+    """
+    Search for log events in several log groups concurrently (MCP wrapper).
+
+    Searches run in batches whose size adapts to observed CloudWatch latency.
+
+    Use this instead of calling search_log_events once per log group.
+
+    Args:
+        log_group_names: Names of the log groups to search
+        filter_pattern: CloudWatch Logs filter pattern (optional)
+        hours_back: How many hours back to search (default: 24)
+        max_events: Maximum number of events to return per log group (default: 100)
+
+    Returns:
+        JSON string containing the search result for each log group
+    """
+    loop = asyncio.get_running_loop()
+
+    def _search(log_group_name: str):
+        return loop.run_in_executor(
+            None,
+            functools.partial(
+                search_log_events,
+                log_group_name,
+                filter_pattern,
+                hours_back,
+                max_events,
+            ),
+        )
+
+    # Issue searches in batches sized from observed CloudWatch latency; each
+    # call adapts on its own so concurrent calls don't skew each other
+    batcher = AdaptiveBatcher()
+    results: List[str] = []
+    remaining = list(log_group_names)
+    while remaining:
+        batch_size = batcher.optimal_size()
+        batch, remaining = remaining[:batch_size], remaining[batch_size:]
+        started = time.monotonic()
+        results.extend(await asyncio.gather(*(_search(name) for name in batch)))
+        batcher.record(len(batch), time.monotonic() - started)
+
+    # Each result is already a JSON document; splice them instead of re-encoding
+    return (
+        f'{{"total_groups": {len(results)}, "results": [' + ", ".join(results) + "]}"
+    )
+
+
 def get_recent_log_events(
     log_group_name: str, log_stream_name: str, hours_back: int = 1, max_events: int = 50
 ) -> str:
@@ -306,7 +423,7 @@ def get_recent_log_events(
                 "total_found": len(simplified_events),
                 "events": simplified_events,
             }
-            return json.dumps(mcp_result, ensure_ascii=False, indent=2)
+            return _dumps_result(mcp_result)
         else:
             return json.dumps(
                 {
@@ -446,7 +563,7 @@ def analyze_log_patterns(log_group_name: str, hours_back: int = 24) -> str:
         }
 
         logger.info(f"Analyzed {total_events} events from {log_group_name}")
-        return json.dumps(analysis, ensure_ascii=False, indent=2)
+        return _dumps_result(analysis)
 
     except Exception as e:
         error_msg = f"Error analyzing patterns in {log_group_name}: {str(e)}"
@@ -459,6 +576,7 @@ CLOUDWATCH_TOOLS = [
     list_log_groups,
     list_log_streams,
     search_log_events,
+    search_log_events_batch,
     get_recent_log_events,
     analyze_log_patterns,
 ]
@@ -500,6 +618,7 @@ def get_all_cloudwatch_tools():
             list_log_groups,
             list_log_streams,
             search_log_events,
+            search_log_events_batch,
             get_recent_log_events,
             analyze_log_patterns,
         ]
@@ -50,6 +50,7 @@ Dependencies:
 """
 
 import boto3
+from botocore.config import Config
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any, Union
 import logging
@@ -75,6 +76,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Retry throttled calls inside botocore (exponential backoff with jitter and
+# client-side rate limiting) so agents never see ThrottlingException
+_CLIENT_CONFIG = Config(retries={"max_attempts": 5, "mode": "adaptive"})
+
 # Global client instance (initialized when first used)
 _cloudwatch_logs_client = None
 
@@ -94,7 +99,7 @@ def _get_cloudwatch_logs_client():
                 session_kwargs["region_name"] = settings.aws.region_name
 
             session = boto3.Session(**session_kwargs)
-            _cloudwatch_logs_client = session.client("logs")
+            _cloudwatch_logs_client = session.client("logs", config=_CLIENT_CONFIG)
 
             # Test connection
             _cloudwatch_logs_client.describe_log_groups(limit=1)
@@ -139,7 +144,7 @@ def create_cloudwatch_logs_client(
             session_kwargs["region_name"] = region_name
 
         session = boto3.Session(**session_kwargs)
-        client = session.client("logs")
+        client = session.client("logs", config=_CLIENT_CONFIG)
 
         # Test connection
         client.describe_log_groups(limit=1)
@@ -68,6 +68,7 @@ Dependencies:
 """
 
 import boto3
+from botocore.config import Config
 import json
 import logging
 from datetime import datetime, timezone, timedelta
@@ -95,6 +96,10 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Retry throttled calls inside botocore (exponential backoff with jitter and
+# client-side rate limiting) so agents never see ThrottlingException
+_CLIENT_CONFIG = Config(retries={"max_attempts": 5, "mode": "adaptive"})
+
 # Global client instance (initialized when first used)
 _cloudwatch_client = None
 
@@ -114,7 +119,7 @@ def _get_cloudwatch_client():
                 session_kwargs["region_name"] = settings.aws.region_name
 
             session = boto3.Session(**session_kwargs)
-            _cloudwatch_client = session.client("cloudwatch")
+            _cloudwatch_client = session.client("cloudwatch", config=_CLIENT_CONFIG)
 
             # Test connection
             _cloudwatch_client.list_metrics(MaxRecords=1)
@@ -159,7 +164,7 @@ def create_cloudwatch_metrics_client(
             session_kwargs["region_name"] = region_name
 
         session = boto3.Session(**session_kwargs)
-        client = session.client("cloudwatch")
+        client = session.client("cloudwatch", config=_CLIENT_CONFIG)
 
         # Test connection
         client.list_metrics(MaxRecords=1)